@@ -28,8 +28,8 @@ class InventoryTracker:
         self.logger = logger
         
         # Konfigurationswerte laden
-        self.history_days = int(self.config.get_value('Report', 'history_days', '30'))
-        self.highlight_threshold = int(self.config.get_value('Report', 'highlight_threshold', '10'))
+        self.history_days = self.config.get_int('Report', 'history_days', 30)
+        self.highlight_threshold = self.config.get_int('Report', 'highlight_threshold', 10)
         self.data_path = os.path.join('data', 'inventory')
         
         # Datenverzeichnis erstellen, falls nicht vorhanden
@@ -386,7 +386,7 @@ class InventoryTracker:
             self.logger.log_info("Bereinige alte Bestandsdaten...")
             
             # Maximales Alter der Daten aus Konfiguration
-            max_data_age = int(self.config.get_value('Scheduler', 'max_data_age', '90'))
+            max_data_age = self.config.get_int('Scheduler', 'max_data_age', 90)
             cutoff_date = datetime.now() - timedelta(days=max_data_age)
             
             deleted_count = 0
@@ -31,8 +31,8 @@ class ReportGenerator:
         self.logger = logger
         
         # Konfigurationswerte laden
-        self.history_days = int(self.config.get_value('Report', 'history_days', '30'))
-        self.highlight_threshold = int(self.config.get_value('Report', 'highlight_threshold', '10'))
+        self.history_days = self.config.get_int('Report', 'history_days', 30)
+        self.highlight_threshold = self.config.get_int('Report', 'highlight_threshold', 10)
         self.export_path = self.config.get_value('Report', 'export_path', './reports')
         self.default_export_format = self.config.get_value('Report', 'default_export_format', 'excel')
         
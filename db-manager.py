@@ -9,7 +9,7 @@ Verwaltet Verbindungen zu MySQL und MSSQL Datenbanken.
 import time
 from datetime import datetime
 from sqlalchemy import create_engine, exc
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import QueuePool, NullPool
 
 
 class DatabaseManager:
@@ -26,8 +26,8 @@ class DatabaseManager:
         self.logger = logger
         self.engine = None
         self.connection_type = self.config.get_value('Database', 'type', 'mysql')
-        self.max_retries = int(self.config.get_value('Scheduler', 'retry_attempts', '3'))
-        self.retry_interval = int(self.config.get_value('Scheduler', 'retry_interval', '10'))
+        self.max_retries = self.config.get_int('Scheduler', 'retry_attempts', 3)
+        self.retry_interval = self.config.get_int('Scheduler', 'retry_interval', 10)
         
         # Beim Initialisieren gleich die Verbindung herstellen
         self.connect()
@@ -52,14 +52,15 @@ class DatabaseManager:
     
     def connect_mysql(self):
         """Stellt eine Verbindung zu einer MySQL-Datenbank her."""
-        host = self.config.get_value('Database', 'host', 'localhost')
-        port = self.config.get_value('Database', 'port', '3306')
-        username = self.config.get_value('Database', 'username', '')
-        password = self.config.get_value('Database', 'password', '')
-        database = self.config.get_value('Database', 'database', '')
-        max_connections = int(self.config.get_value('Database', 'max_connections', '5'))
+        db = self.config.get_section('Database')
+        host = db.get('host', 'localhost')
+        port = db.get('port', '3306')
+        username = db.get('username', '')
+        password = db.get('password', '')
+        database = db.get('database', '')
+        max_connections = int(db.get('max_connections', '5'))
         
-        connection_string = f"mysql+pymysql://{username}:{password}@{host}:{port}/{database}"
+        connection_string = self._connection_string('mysql', host, port, username, password, database)
         
         self.engine = create_engine(
             connection_string,
@@ -72,15 +73,16 @@ class DatabaseManager:
     
     def connect_mssql(self):
         """Stellt eine Verbindung zu einer MSSQL-Datenbank her."""
-        host = self.config.get_value('Database', 'host', 'localhost')
-        port = self.config.get_value('Database', 'port', '1433')
-        username = self.config.get_value('Database', 'username', '')
-        password = self.config.get_value('Database', 'password', '')
-        database = self.config.get_value('Database', 'database', '')
-        max_connections = int(self.config.get_value('Database', 'max_connections', '5'))
+        db = self.config.get_section('Database')
+        host = db.get('host', 'localhost')
+        port = db.get('port', '1433')
+        username = db.get('username', '')
+        password = db.get('password', '')
+        database = db.get('database', '')
+        max_connections = int(db.get('max_connections', '5'))
         
         # pyodbc für MSSQL verwenden
-        connection_string = f"mssql+pyodbc://{username}:{password}@{host}:{port}/{database}?driver=ODBC+Driver+17+for+SQL+Server"
+        connection_string = self._connection_string('mssql', host, port, username, password, database)
         
         self.engine = create_engine(
             connection_string,
@@ -91,6 +93,61 @@ class DatabaseManager:
             pool_pre_ping=True
         )
     
+    @staticmethod
+    def _connection_string(db_type, host, port, username, password, database):
+        """Erstellt den SQLAlchemy-Verbindungsstring.
+        
+        Args:
+            db_type (str): Datenbanktyp ('mysql' oder 'mssql')
+            host (str): Hostname
+            port (str): Port
+            username (str): Benutzername
+            password (str): Passwort
+            database (str): Datenbankname
+            
+        Returns:
+            str: Verbindungsstring
+        """
+        if db_type.lower() == 'mysql':
+            return f"mysql+pymysql://{username}:{password}@{host}:{port}/{database}"
+        return f"mssql+pyodbc://{username}:{password}@{host}:{port}/{database}?driver=ODBC+Driver+17+for+SQL+Server"
+    
+    def try_connect(self, db_type, host, port, username, password, database, timeout=30):
+        """Prüft Verbindungsparameter mit einer einmaligen Verbindung.
+        
+        Die bestehende Engine und die Konfiguration bleiben dabei unverändert.
+        
+        Args:
+            db_type (str): Datenbanktyp ('mysql' oder 'mssql')
+            host (str): Hostname
+            port (str): Port
+            username (str): Benutzername
+            password (str): Passwort
+            database (str): Datenbankname
+            timeout (int, optional): Verbindungs-Timeout in Sekunden
+            
+        Returns:
+            bool: True, wenn die Verbindung erfolgreich ist, sonst False
+        """
+        connect_args = {'connect_timeout': timeout} if db_type.lower() == 'mysql' else {'timeout': timeout}
+        engine = None
+        
+        try:
+            engine = create_engine(
+                self._connection_string(db_type, host, port, username, password, database),
+                poolclass=NullPool,
+                connect_args=connect_args
+            )
+            with engine.connect() as connection:
+                connection.execute("SELECT 1")
+            return True
+        except Exception as e:
+            self.logger.log_error(f"Verbindungstest fehlgeschlagen: {str(e)}")
+            return False
+        finally:
+            if engine is not None:
+                engine.dispose()
+    
     def get_connection(self):
         """Gibt eine Datenbankverbindung zurück.
         
@@ -19,7 +19,6 @@ from PyQt5.QtGui import QIcon, QFont, QColor, QPixmap
 
 # Anwendungsimporte
 from gui.settings_dialog import SettingsDialog
-from gui.report_view import ReportView
 from core.report_generator import ReportGenerator
 
 
@@ -51,7 +50,7 @@ class MainWindow(QMainWindow):
         self.settings = QSettings("IhreOrganisation", "Artikel-Tracker")
         
         # Aktualisierungsintervall für das Dashboard (in Sekunden)
-        self.refresh_interval = int(self.config.get_value('UI', 'refresh_interval', '300'))
+        self.refresh_interval = self.config.get_int('UI', 'refresh_interval', 300)
         
         # Timer für die automatische Aktualisierung
         self.refresh_timer = QTimer(self)
@@ -452,6 +451,9 @@ class MainWindow(QMainWindow):
     def open_report_view(self):
         """Öffnet die Berichtsansicht."""
         try:
+            # Berichtsansicht (matplotlib, numpy) erst beim ersten Öffnen laden
+            from gui.report_view import ReportView
+            
             report_view = ReportView(self.report_generator, self.config, self.logger, self)
             report_view.show()
             self.logger.log_info("Berichtsansicht geöffnet")
@@ -468,7 +470,7 @@ class MainWindow(QMainWindow):
                 self.config.load_config()
                 
                 # Aktualisierungsintervall aktualisieren
-                new_interval = int(self.config.get_value('UI', 'refresh_interval', '300'))
+                new_interval = self.config.get_int('UI', 'refresh_interval', 300)
                 if new_interval != self.refresh_interval:
                     self.refresh_interval = new_interval
                     
@@ -7,15 +7,22 @@ Ermöglicht die Anzeige und Analyse von Berichts- und Trenddaten.
 """
 
 import os
+import csv
+import importlib.util
 import json
 from datetime import datetime, timedelta
+from functools import partial
+from operator import itemgetter
+import numpy as np
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                            QLabel, QPushButton, QTableWidget, QTableWidgetItem,
                            QComboBox, QDateEdit, QLineEdit, QGroupBox, 
                            QFormLayout, QHeaderView, QSplitter, QMessageBox,
                            QAction, QMenu, QToolBar, QCheckBox, QFileDialog,
-                           QTabWidget, QFrame, QSizePolicy, QSpinBox, QDialog)
-from PyQt5.QtCore import Qt, QDate, QDateTime
+                           QTabWidget, QFrame, QSizePolicy, QSpinBox, QDialog,
+                           QDialogButtonBox, QProgressDialog, QTableView)
+from PyQt5.QtCore import (Qt, QDate, QDateTime, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal,
+                          QAbstractTableModel, QModelIndex, QVariant, QSortFilterProxyModel)
 from PyQt5.QtGui import QIcon, QFont, QColor, QPixmap
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
@@ -23,6 +30,36 @@ from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as Navigatio
 from matplotlib.figure import Figure
 
 
+# Spalten der Haupt- und Deaktivierungstabelle
+MAIN_TABLE_KEYS = ('artikel_id', 'artikelnummer', 'bezeichnung', 'lager_name')
+DEACTIVATION_TABLE_KEYS = ('artikel_id', 'artikelnummer', 'bezeichnung')
+
+# Datentyp der Trendreihen (Artikelzahlen passen in 32 Bit)
+SERIES_DTYPE = np.int32
+
+# Kopfzeile des CSV-Trendexports
+CSV_HEADER = ("Datum", "Aktive Artikel", "Nullbestand")
+
+
+def _row_values(getter, keys, item, default=''):
+    """Liest die Spaltenwerte einer Zeile in einem Aufruf.
+    
+    Args:
+        getter (operator.itemgetter): Vorbereiteter Getter für die Schlüssel
+        keys (tuple): Spaltenschlüssel in Tabellenreihenfolge
+        item (dict): Datenzeile
+        default (any): Wert für fehlende Schlüssel
+        
+    Returns:
+        tuple: Spaltenwerte
+    """
+    try:
+        return getter(item)
+    except KeyError:
+        # Unvollständige Zeilen über den langsamen Pfad auffüllen
+        return tuple(item.get(key, default) for key in keys)
+
+
 class ReportView(QMainWindow):
     """Klasse für die Berichtsvisualisierung."""
     
@@ -45,6 +82,12 @@ class ReportView(QMainWindow):
         self.current_data = None
         self.trend_data = None
         
+        # Diagramm wird erst beim Öffnen des Diagramm-Tabs gezeichnet
+        self._chart_dirty = False
+        
+        # Zuletzt geladene Kategorien (für Filter und Trenddialog)
+        self._cached_categories = ()
+        
         # UI einrichten
         self.setup_ui()
         
@@ -92,7 +135,14 @@ class ReportView(QMainWindow):
         self.highlight_threshold_spin = QSpinBox()
         self.highlight_threshold_spin.setRange(1, 100)
         self.highlight_threshold_spin.setSuffix(" %")
-        self.highlight_threshold_spin.setValue(int(self.config.get_value('Report', 'highlight_threshold', '10')))
+        self.highlight_threshold_spin.setValue(self.config.get_int('Report', 'highlight_threshold', 10))
+        
+        # Schwellenänderungen gebündelt übernehmen statt bei jedem Schritt neu einzufärben
+        self._highlight_timer = QTimer(self)
+        self._highlight_timer.setSingleShot(True)
+        self._highlight_timer.setInterval(250)
+        self._highlight_timer.timeout.connect(self.highlight_changes)
+        self.highlight_threshold_spin.valueChanged.connect(lambda _value: self._highlight_timer.start())
         filter_layout.addRow("Hervorhebungsschwelle:", self.highlight_threshold_spin)
         
         self.filter_edit = QLineEdit()
@@ -175,12 +225,14 @@ class ReportView(QMainWindow):
         
         self.figure = Figure(figsize=(8, 6), dpi=100)
         self.canvas = FigureCanvas(self.figure)
-        self.toolbar = NavigationToolbar(self.canvas, self)
         
-        chart_layout.addWidget(self.toolbar)
+        # Toolbar wird erst beim ersten Öffnen des Diagramm-Tabs erzeugt
+        self.toolbar = None
+        self._chart_layout = chart_layout
         chart_layout.addWidget(self.canvas)
         
-        self.tabs.addTab(chart_widget, "Diagramm")
+        self.chart_tab_index = self.tabs.addTab(chart_widget, "Diagramm")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
         
         # Menü erstellen
         self.create_menu()
@@ -247,16 +299,19 @@ class ReportView(QMainWindow):
         
         try:
             # Ausgewähltes Datum holen
-            selected_date = self.date_edit.date().toPyDate()
+            qdate = self.date_edit.date()
+            display_date = qdate.toString('dd.MM.yyyy')
+            selected_date = qdate.toPyDate()
             
             # Prüfen, ob bereits ein Bericht existiert oder einen generieren
             report = self.report_generator.generate_daily_report(selected_date)
             
             if not report:
-                self.statusBar().showMessage(f"Keine Daten für {selected_date.strftime('%d.%m.%Y')} gefunden")
+                self.statusBar().showMessage(f"Keine Daten für {display_date} gefunden")
                 return
             
             self.current_data = report
+            self._chart_dirty = True
             
             # Kategorien für Filter laden
             self.load_categories()
@@ -264,10 +319,10 @@ class ReportView(QMainWindow):
             # Tabellen aktualisieren
             self.update_tables()
             
-            # Diagramm aktualisieren
-            self.update_chart()
+            # Diagramm nur sofort zeichnen, wenn der Diagramm-Tab sichtbar ist
+            self._on_tab_changed(self.tabs.currentIndex())
             
-            self.statusBar().showMessage(f"Bericht für {selected_date.strftime('%d.%m.%Y')} geladen")
+            self.statusBar().showMessage(f"Bericht für {display_date} geladen")
             
         except Exception as e:
             self.logger.log_error(f"Fehler beim Laden der Berichtsdaten: {str(e)}", exc_info=True)
@@ -293,13 +348,13 @@ class ReportView(QMainWindow):
                 if category:
                     categories.add(category)
             
+            self._cached_categories = tuple(sorted(categories))
+            
             # ComboBox aktualisieren
             current_text = self.category_combo.currentText()
             self.category_combo.clear()
             self.category_combo.addItem("Alle Kategorien")
-            
-            for category in sorted(categories):
-                self.category_combo.addItem(category)
+            self.category_combo.addItems(self._cached_categories)
             
             # Text wiederherstellen, falls vorhanden
             index = self.category_combo.findText(current_text)
@@ -343,18 +398,20 @@ class ReportView(QMainWindow):
             ["Artikel-ID", "Artikelnummer", "Bezeichnung", "Lager", "Bestand"]
         )
         
+        keys = MAIN_TABLE_KEYS
+        getter = itemgetter(*keys)
+        
         # Daten einfügen
         for row, item in enumerate(filtered_data):
             self.report_table.insertRow(row)
             
-            self.report_table.setItem(row, 0, QTableWidgetItem(str(item.get('artikel_id', ''))))
-            self.report_table.setItem(row, 1, QTableWidgetItem(str(item.get('artikelnummer', ''))))
-            self.report_table.setItem(row, 2, QTableWidgetItem(str(item.get('bezeichnung', ''))))
-            self.report_table.setItem(row, 3, QTableWidgetItem(str(item.get('lager_name', ''))))
+            for col, value in enumerate(_row_values(getter, keys, item)):
+                self.report_table.setItem(row, col, QTableWidgetItem(str(value)))
             
             # Bestandszelle mit Nullbestand rot einfärben
-            bestand_item = QTableWidgetItem(str(item.get('bestand', 0)))
-            if item.get('bestand', 0) == 0:
+            bestand = item.get('bestand', 0)
+            bestand_item = QTableWidgetItem(str(bestand))
+            if bestand == 0:
                 bestand_item.setBackground(QColor(255, 200, 200))
             
             self.report_table.setItem(row, 4, bestand_item)
@@ -379,6 +436,10 @@ class ReportView(QMainWindow):
             ["Artikelnummer", "Bezeichnung", "Alter Bestand", "Neuer Bestand", "Änderung", "Änderung (%)"]
         )
         
+        # Hervorhebungsschwelle einmal vor der Schleife lesen (Prozentpunkte,
+        # gleiche Einheit wie 'change_percent')
+        threshold = self.highlight_threshold_spin.value()
+        
         # Daten einfügen
         for row, item in enumerate(filtered_data):
             self.changes_table.insertRow(row)
@@ -391,23 +452,23 @@ class ReportView(QMainWindow):
             change = item.get('change', 0)
             change_item = QTableWidgetItem(str(change))
             
-            # Farbe basierend auf Änderung
-            if change > 0:
-                change_item.setBackground(QColor(200, 255, 200))  # Grün für Zunahme
-            elif change < 0:
-                change_item.setBackground(QColor(255, 200, 200))  # Rot für Abnahme
-            
-            self.changes_table.setItem(row, 4, change_item)
-            
             # Prozentuale Änderung
             change_percent = item.get('change_percent', 0)
             percent_item = QTableWidgetItem(f"{change_percent:.2f}%")
             
-            if change_percent > 0:
-                percent_item.setBackground(QColor(200, 255, 200))
-            elif change_percent < 0:
-                percent_item.setBackground(QColor(255, 200, 200))
+            # Farbe nur ab der Hervorhebungsschwelle setzen
+            if abs(change_percent) >= threshold:
+                if change > 0:
+                    change_item.setBackground(QColor(200, 255, 200))  # Grün für Zunahme
+                elif change < 0:
+                    change_item.setBackground(QColor(255, 200, 200))  # Rot für Abnahme
+                
+                if change_percent > 0:
+                    percent_item.setBackground(QColor(200, 255, 200))
+                elif change_percent < 0:
+                    percent_item.setBackground(QColor(255, 200, 200))
             
+            self.changes_table.setItem(row, 4, change_item)
             self.changes_table.setItem(row, 5, percent_item)
     
     def update_deactivations_table(self):
@@ -430,19 +491,18 @@ class ReportView(QMainWindow):
             ["Artikel-ID", "Artikelnummer", "Bezeichnung"]
         )
         
+        keys = DEACTIVATION_TABLE_KEYS
+        getter = itemgetter(*keys)
+        
         # Daten einfügen
         for row, item in enumerate(filtered_data):
             self.deactivations_table.insertRow(row)
             
-            self.deactivations_table.setItem(row, 0, QTableWidgetItem(str(item.get('artikel_id', ''))))
-            self.deactivations_table.setItem(row, 1, QTableWidgetItem(str(item.get('artikelnummer', ''))))
-            self.deactivations_table.setItem(row, 2, QTableWidgetItem(str(item.get('bezeichnung', ''))))
-            
             # Alle Zellen rot einfärben
-            for col in range(3):
-                cell = self.deactivations_table.item(row, col)
-                if cell:
-                    cell.setBackground(QColor(255, 200, 200))
+            for col, value in enumerate(_row_values(getter, keys, item)):
+                cell = QTableWidgetItem(str(value))
+                cell.setBackground(QColor(255, 200, 200))
+                self.deactivations_table.setItem(row, col, cell)
     
     def update_chart(self):
         """Aktualisiert das Diagramm."""
@@ -493,15 +553,29 @@ class ReportView(QMainWindow):
         except Exception as e:
             self.logger.log_error(f"Fehler beim Aktualisieren des Diagramms: {str(e)}", exc_info=True)
     
+    def _on_tab_changed(self, index):
+        """Zeichnet das Diagramm verzögert, sobald der Diagramm-Tab aktiv wird.
+        
+        Args:
+            index (int): Index des aktiven Tabs
+        """
+        if index != self.chart_tab_index:
+            return
+        
+        if self.toolbar is None:
+            self.toolbar = NavigationToolbar(self.canvas, self)
+            self._chart_layout.insertWidget(0, self.toolbar)
+        
+        if self._chart_dirty:
+            self._chart_dirty = False
+            self.update_chart()
+    
     def apply_filters(self):
         """Wendet Filter auf Berichtsdaten an."""
         if not self.current_data:
             return
         
         try:
-            # Threshold aktualisieren
-            threshold = self.highlight_threshold_spin.value()
-            
             # Alle Tabellen aktualisieren
             self.update_tables()
             
@@ -553,21 +627,33 @@ class ReportView(QMainWindow):
     
     def reset_filters(self):
         """Setzt alle Filter zurück."""
-        self.filter_edit.clear()
-        self.category_combo.setCurrentIndex(0)
-        self.show_zero_check.setChecked(False)
-        self.highlight_threshold_spin.setValue(int(self.config.get_value('Report', 'highlight_threshold', '10')))
+        # Signale blockieren, damit die Tabellen nur einmal am Ende neu aufgebaut werden
+        widgets = (self.filter_edit, self.category_combo, self.show_zero_check, self.highlight_threshold_spin)
+        for widget in widgets:
+            widget.blockSignals(True)
+        try:
+            self.filter_edit.clear()
+            self.category_combo.setCurrentIndex(0)
+            self.show_zero_check.setChecked(False)
+            self.highlight_threshold_spin.setValue(self.config.get_int('Report', 'highlight_threshold', 10))
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+        self._highlight_timer.stop()
         
         # Filter anwenden
         self.apply_filters()
     
     def highlight_changes(self):
         """Hebt signifikante Änderungen hervor."""
-        # Diese Methode passt die Schwellwerte für Hervorhebungen an
-        threshold = self.highlight_threshold_spin.value()
+        # Die Schwelle wirkt nur auf die Änderungstabelle und wird dort ausgewertet
+        if not self.current_data:
+            return
         
-        # Änderungen in den Tabellen hervorheben
-        self.update_tables()
+        try:
+            self.update_changes_table()
+        except Exception as e:
+            self.logger.log_error(f"Fehler beim Hervorheben der Änderungen: {str(e)}", exc_info=True)
     
     def export_report(self, format_type):
         """Exportiert Bericht in Datei.
@@ -610,7 +696,7 @@ class ReportView(QMainWindow):
         """Zeigt den Trendbericht an."""
         try:
             # Dialog zur Auswahl des Zeitraums anzeigen
-            dialog = TrendReportDialog(self)
+            dialog = TrendReportDialog(self._cached_categories, self)
             if dialog.exec_() != QDialog.Accepted:
                 return
             
@@ -645,10 +731,11 @@ class ReportView(QMainWindow):
 class TrendReportDialog(QDialog):
     """Dialog zur Auswahl des Zeitraums für den Trendbericht."""
     
-    def __init__(self, parent=None):
+    def __init__(self, categories, parent=None):
         """Initialisiert den Dialog.
         
         Args:
+            categories (tuple): Bereits geladene Kategorien der Berichtsansicht
             parent (QWidget, optional): Übergeordnetes Widget
         """
         super().__init__(parent)
@@ -682,7 +769,7 @@ class TrendReportDialog(QDialog):
         
         self.category_combo = QComboBox()
         self.category_combo.addItem("Alle Kategorien")
-        # Hier könnten Kategorien hinzugefügt werden
+        self.category_combo.addItems(categories)
         filter_layout.addRow("Kategorie:", self.category_combo)
         
         layout.addWidget(filter_group)
@@ -694,6 +781,77 @@ class TrendReportDialog(QDialog):
         layout.addWidget(button_box)
 
 
+class TrendTableModel(QAbstractTableModel):
+    """Tabellenmodell für die Trendreihen, direkt auf den Arrays."""
+    
+    HEADERS = ("Datum", "Aktive Artikel", "Nullbestand")
+    
+    def __init__(self, parent=None):
+        """Initialisiert das Modell.
+        
+        Args:
+            parent (QObject, optional): Übergeordnetes Objekt
+        """
+        super().__init__(parent)
+        
+        self.dates = []
+        self.active = np.zeros(0, dtype=SERIES_DTYPE)
+        self.zero = np.zeros(0, dtype=SERIES_DTYPE)
+    
+    def set_series(self, dates, active, zero):
+        """Setzt neue Zeitreihen und benachrichtigt angeschlossene Views.
+        
+        Args:
+            dates (list): Datumsangaben
+            active (numpy.ndarray): Aktive Artikel je Datum
+            zero (numpy.ndarray): Nullbestand je Datum
+        """
+        self.beginResetModel()
+        self.dates = dates
+        self.active = active
+        self.zero = zero
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Gibt die Anzahl der Zeilen zurück."""
+        if parent.isValid():
+            return 0
+        return len(self.dates)
+    
+    def columnCount(self, parent=QModelIndex()):
+        """Gibt die Anzahl der Spalten zurück."""
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Liefert den Zellwert erst bei Bedarf.
+        
+        Args:
+            index (QModelIndex): Zellindex
+            role (int): Datenrolle
+            
+        Returns:
+            QVariant: Zellwert (Zahlen als int, für Qt.UserRole zum Sortieren)
+        """
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.UserRole):
+            return QVariant()
+        
+        row = index.row()
+        column = index.column()
+        if column == 0:
+            return self.dates[row]
+        if column == 1:
+            return int(self.active[row])
+        return int(self.zero[row])
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """Liefert die Spaltenüberschriften."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
 class TrendReportView(QMainWindow):
     """Fenster zur Anzeige des Trendberichts."""
     
@@ -710,6 +868,9 @@ class TrendReportView(QMainWindow):
         self.trend_data = trend_data
         self.logger = logger
         
+        # Zeitreihen einmalig als parallele Arrays aufbereiten
+        self._materialize_series()
+        
         # UI einrichten
         self.setup_ui()
         
@@ -751,8 +912,18 @@ class TrendReportView(QMainWindow):
         summary_widget = QWidget()
         summary_layout = QVBoxLayout(summary_widget)
         
-        self.summary_table = QTableWidget()
-        self.summary_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.summary_model = TrendTableModel(self)
+        
+        # Proxy sortiert über Qt.UserRole nach den Rohwerten statt nach Text
+        self.summary_proxy = QSortFilterProxyModel(self)
+        self.summary_proxy.setSourceModel(self.summary_model)
+        self.summary_proxy.setSortRole(Qt.UserRole)
+        
+        self.summary_table = QTableView()
+        self.summary_table.setModel(self.summary_proxy)
+        self.summary_table.setSortingEnabled(True)
+        self.summary_table.sortByColumn(0, Qt.AscendingOrder)
+        self.summary_table.setSelectionBehavior(QTableView.SelectRows)
         self.summary_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         summary_layout.addWidget(self.summary_table)
         
@@ -764,18 +935,81 @@ class TrendReportView(QMainWindow):
         
         self.figure = Figure(figsize=(8, 6), dpi=100)
         self.canvas = FigureCanvas(self.figure)
-        self.toolbar = NavigationToolbar(self.canvas, self)
         
-        chart_layout.addWidget(self.toolbar)
+        # Toolbar wird erst beim ersten Öffnen des Diagramm-Tabs erzeugt
+        self.toolbar = None
+        self._chart_layout = chart_layout
         chart_layout.addWidget(self.canvas)
         
-        self.tabs.addTab(chart_widget, "Diagramm")
+        self.chart_tab_index = self.tabs.addTab(chart_widget, "Diagramm")
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+        
+        # Achse und Linien des Trenddiagramms (beim ersten Zeichnen angelegt)
+        self._trend_ax = None
+        self._trend_lines = None
+        
+        # Laufender Export
+        self._export_worker = None
+        self._export_progress = None
         
         # Export-Button
         export_button = QPushButton("Exportieren")
         export_button.clicked.connect(self.export_trend_report)
         main_layout.addWidget(export_button)
     
+    def _on_tab_changed(self, index):
+        """Erzeugt die Diagramm-Toolbar beim ersten Öffnen des Diagramm-Tabs.
+        
+        Args:
+            index (int): Index des aktiven Tabs
+        """
+        if index == self.chart_tab_index and self.toolbar is None:
+            self.toolbar = NavigationToolbar(self.canvas, self)
+            self._chart_layout.insertWidget(0, self.toolbar)
+    
+    def _materialize_series(self):
+        """Bereitet die Zeitreihen aus den Trenddaten als parallele Arrays auf.
+        
+        Tabelle, Diagramm und Export lesen anschließend nur noch diese Arrays
+        statt die Dictionaries pro Datum erneut abzufragen.
+        """
+        # Zusammenfassung und Reihen einmal binden statt get()-Ketten je Verbraucher;
+        # ein fehlender Schlüssel leert nur die eigene Reihe
+        summary = (self.trend_data or {}).get('summary', {})
+        dates = summary.get('dates', [])
+        active_articles = summary.get('active_articles', {})
+        zero_inventory = summary.get('zero_inventory', {})
+        
+        self._summary = summary
+        self._dates = list(dates)
+        self._active_arr = self._series_values(active_articles, self._dates)
+        self._zero_arr = self._series_values(zero_inventory, self._dates)
+    
+    @staticmethod
+    def _series_values(values, dates):
+        """Liest die Werte einer Zeitreihe in Datumsreihenfolge als Array.
+        
+        Args:
+            values (dict): Werte je Datum
+            dates (list): Datumsangaben in Anzeigereihenfolge
+            
+        Returns:
+            numpy.ndarray: Werte als Array vom Typ SERIES_DTYPE
+        """
+        if not dates:
+            return np.zeros(0, dtype=SERIES_DTYPE)
+        
+        try:
+            # Alle Schlüssel in einem C-Aufruf lesen
+            fetched = itemgetter(*dates)(values)
+            if len(dates) == 1:
+                fetched = (fetched,)
+        except KeyError:
+            # Fehlende Tage wie bisher mit 0 auffüllen
+            fetched = [values.get(date, 0) for date in dates]
+        
+        return np.fromiter(fetched, dtype=SERIES_DTYPE, count=len(dates))
+    
     def display_trend_data(self):
         """Zeigt Trenddaten an."""
         if not self.trend_data:
@@ -787,8 +1021,24 @@ class TrendReportView(QMainWindow):
                 f"{self.trend_data.get('start_date', '')} bis {self.trend_data.get('end_date', '')}"
             )
             
-            summary = self.trend_data.get('summary', {})
-            trend = summary.get('trend', 'stable')
+            summary = self._summary
+            trend = summary.get('trend')
+            avg_articles = summary.get('avg_articles_per_day')
+            
+            # Fehlende Kennzahlen nach denselben Regeln wie im ReportGenerator berechnen
+            if avg_articles is None:
+                total_articles = summary.get('total_articles') or {}
+                if total_articles:
+                    avg_articles = sum(total_articles.values()) / len(total_articles)
+            
+            if trend is None and self._active_arr.size > 1:
+                # Erster und letzter Tag der aktiven Artikel, 5%-Regel
+                active_first = int(self._active_arr[0])
+                active_last = int(self._active_arr[-1])
+                if active_last > active_first * 1.05:
+                    trend = 'increasing'
+                elif active_last < active_first * 0.95:
+                    trend = 'decreasing'
             
             trend_text = "Stabil"
             if trend == 'increasing':
@@ -797,7 +1047,7 @@ class TrendReportView(QMainWindow):
                 trend_text = "Fallend"
             
             self.summary_label.setText(
-                f"Trend: {trend_text}, Ø Artikel pro Tag: {summary.get('avg_articles_per_day', 0):.2f}"
+                f"Trend: {trend_text}, Ø Artikel pro Tag: {avg_articles or 0:.2f}"
             )
             
             # Zusammenfassungstabelle aktualisieren
@@ -811,83 +1061,56 @@ class TrendReportView(QMainWindow):
     
     def update_summary_table(self):
         """Aktualisiert die Zusammenfassungstabelle."""
-        if not self.trend_data or 'summary' not in self.trend_data:
+        if not self._dates:
             return
         
-        summary = self.trend_data.get('summary', {})
-        dates = summary.get('dates', [])
-        
-        if not dates:
-            return
-        
-        # Tabelle vorbereiten
-        self.summary_table.clear()
-        self.summary_table.setRowCount(len(dates))
-        self.summary_table.setColumnCount(3)
-        self.summary_table.setHorizontalHeaderLabels(
-            ["Datum", "Aktive Artikel", "Nullbestand"]
-        )
-        
-        # Daten einfügen
-        active_articles = summary.get('active_articles', {})
-        zero_inventory = summary.get('zero_inventory', {})
-        
-        for row, date in enumerate(dates):
-            self.summary_table.setItem(row, 0, QTableWidgetItem(date))
-            
-            active_item = QTableWidgetItem(str(active_articles.get(date, 0)))
-            self.summary_table.setItem(row, 1, active_item)
-            
-            zero_item = QTableWidgetItem(str(zero_inventory.get(date, 0)))
-            self.summary_table.setItem(row, 2, zero_item)
+        self.summary_model.set_series(self._dates, self._active_arr, self._zero_arr)
     
     def update_trend_chart(self):
         """Aktualisiert das Trenddiagramm."""
-        if not self.trend_data or 'summary' not in self.trend_data:
-            return
-        
         try:
-            # Figur leeren
-            self.figure.clear()
-            
-            summary = self.trend_data.get('summary', {})
-            dates = summary.get('dates', [])
+            dates = self._dates
             
             if not dates:
                 return
             
-            # Aktive Artikel und Nullbestand plotten
-            active_articles = summary.get('active_articles', {})
-            zero_inventory = summary.get('zero_inventory', {})
-            
-            ax = self.figure.add_subplot(111)
+            x = np.arange(len(dates))
             
-            # Daten in Listen umwandeln
-            x = range(len(dates))
-            y1 = [active_articles.get(date, 0) for date in dates]
-            y2 = [zero_inventory.get(date, 0) for date in dates]
+            if self._trend_lines is None:
+                # Achsen und Linien nur beim ersten Aufruf anlegen
+                ax = self.figure.add_subplot(111)
+                active_line, = ax.plot([], [], 'b-', label='Aktive Artikel')
+                zero_line, = ax.plot([], [], 'r-', label='Nullbestand')
+                
+                # Achsenbeschriftungen
+                ax.set_xlabel('Datum')
+                ax.set_ylabel('Anzahl')
+                ax.set_title('Artikeländerungen im Zeitverlauf')
+                
+                # Legende
+                ax.legend()
+                
+                self._trend_ax = ax
+                self._trend_lines = (active_line, zero_line)
             
-            # Plots erstellen
-            ax.plot(x, y1, 'b-', label='Aktive Artikel')
-            ax.plot(x, y2, 'r-', label='Nullbestand')
+            ax = self._trend_ax
+            active_line, zero_line = self._trend_lines
             
-            # Achsenbeschriftungen
-            ax.set_xlabel('Datum')
-            ax.set_ylabel('Anzahl')
-            ax.set_title('Artikeländerungen im Zeitverlauf')
+            # Nur die Liniendaten austauschen
+            active_line.set_data(x, self._active_arr)
+            zero_line.set_data(x, self._zero_arr)
+            ax.relim()
+            ax.autoscale_view()
             
             # X-Achsen-Labels anpassen
             ax.set_xticks(x)
             ax.set_xticklabels(dates, rotation=45, ha='right')
             
-            # Legende
-            ax.legend()
-            
             # Layout anpassen
             self.figure.tight_layout()
             
-            # Canvas aktualisieren
-            self.canvas.draw()
+            # Neuzeichnen in der Ereignisschleife zusammenfassen
+            self.canvas.draw_idle()
             
         except Exception as e:
             self.logger.log_error(f"Fehler beim Aktualisieren des Trenddiagramms: {str(e)}", exc_info=True)
@@ -907,11 +1130,11 @@ class TrendReportView(QMainWindow):
             format_layout.addWidget(format_label)
             
             csv_button = QPushButton("CSV")
-            csv_button.clicked.connect(lambda: self.do_export("csv", format_dialog))
+            csv_button.clicked.connect(partial(self.do_export, "csv", format_dialog))
             format_layout.addWidget(csv_button)
             
             excel_button = QPushButton("Excel")
-            excel_button.clicked.connect(lambda: self.do_export("excel", format_dialog))
+            excel_button.clicked.connect(partial(self.do_export, "excel", format_dialog))
             format_layout.addWidget(excel_button)
             
             cancel_button = QPushButton("Abbrechen")
@@ -927,6 +1150,8 @@ class TrendReportView(QMainWindow):
     def do_export(self, format_type, dialog):
         """Führt den Export durch.
         
+        Das Schreiben der Datei läuft im globalen QThreadPool.
+        
         Args:
             format_type (str): Exportformat
             dialog (QDialog): Formatdialog zum Schließen
@@ -934,65 +1159,155 @@ class TrendReportView(QMainWindow):
         try:
             dialog.accept()
             
+            exporter = _EXPORTERS.get(format_type)
+            if exporter is None:
+                self.logger.log_warning(f"Unbekanntes Exportformat: {format_type}")
+                return
+            
+            write, caption, file_filter, label, requires_pandas = exporter
+            
             # Dateinamen generieren
             filename = f"trendbericht_{self.trend_data.get('start_date', '')}_bis_{self.trend_data.get('end_date', '')}"
             
             # Zieldatei auswählen
-            if format_type == "csv":
-                filepath, _ = QFileDialog.getSaveFileName(
-                    self, "CSV-Datei speichern", filename, "CSV-Dateien (*.csv)"
-                )
-                if not filepath:
-                    return
-                
-                # Daten in CSV exportieren
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    # Header
-                    f.write("Datum,Aktive Artikel,Nullbestand\n")
-                    
-                    # Daten
-                    summary = self.trend_data.get('summary', {})
-                    dates = summary.get('dates', [])
-                    active_articles = summary.get('active_articles', {})
-                    zero_inventory = summary.get('zero_inventory', {})
-                    
-                    for date in dates:
-                        f.write(f"{date},{active_articles.get(date, 0)},{zero_inventory.get(date, 0)}\n")
-            
-            elif format_type == "excel":
-                filepath, _ = QFileDialog.getSaveFileName(
-                    self, "Excel-Datei speichern", filename, "Excel-Dateien (*.xlsx)"
-                )
-                if not filepath:
-                    return
-                
-                # Daten in Excel exportieren
-                try:
-                    import pandas as pd
-                    
-                    # Daten vorbereiten
-                    summary = self.trend_data.get('summary', {})
-                    dates = summary.get('dates', [])
-                    active_articles = summary.get('active_articles', {})
-                    zero_inventory = summary.get('zero_inventory', {})
-                    
-                    data = []
-                    for date in dates:
-                        data.append({
-                            'Datum': date,
-                            'Aktive Artikel': active_articles.get(date, 0),
-                            'Nullbestand': zero_inventory.get(date, 0)
-                        })
-                    
-                    df = pd.DataFrame(data)
-                    df.to_excel(filepath, index=False)
-                    
-                except ImportError:
-                    QMessageBox.warning(self, "Export", "Pandas ist nicht installiert. Excel-Export nicht möglich.")
-                    return
+            filepath, _ = QFileDialog.getSaveFileName(self, caption, filename, file_filter)
+            if not filepath:
+                return
+            
+            # Pandas wird erst im Export-Thread importiert, hier nur die Verfügbarkeit prüfen
+            if requires_pandas and importlib.util.find_spec('pandas') is None:
+                QMessageBox.warning(self, "Export", f"Pandas ist nicht installiert. {label}-Export nicht möglich.")
+                return
             
-            QMessageBox.information(self, "Export", f"Trendbericht wurde exportiert nach:\n{filepath}")
+            self._start_export(
+                partial(write, filepath, self._dates, self._active_arr, self._zero_arr), filepath
+            )
             
         except Exception as e:
             self.logger.log_error(f"Fehler beim Exportieren: {str(e)}", exc_info=True)
             QMessageBox.critical(self, "Fehler", f"Fehler beim Exportieren:\n{str(e)}")
+    
+    def _start_export(self, write, filepath):
+        """Startet das Schreiben der Exportdatei im Hintergrund.
+        
+        Args:
+            write (callable): Funktion, die die Datei schreibt
+            filepath (str): Zieldatei
+        """
+        self._export_progress = QProgressDialog("Trendbericht wird exportiert...", None, 0, 0, self)
+        self._export_progress.setWindowTitle("Export")
+        self._export_progress.setWindowModality(Qt.WindowModal)
+        self._export_progress.setMinimumDuration(0)
+        self._export_progress.show()
+        
+        # Referenz halten, damit die Signale bis zum Ende gültig bleiben
+        self._export_worker = ExportWorker(write, filepath)
+        self._export_worker.signals.finished.connect(self._on_export_finished)
+        self._export_worker.signals.error.connect(self._on_export_error)
+        QThreadPool.globalInstance().start(self._export_worker)
+    
+    def _finish_export(self):
+        """Schließt die Fortschrittsanzeige nach dem Export."""
+        if self._export_progress is not None:
+            self._export_progress.close()
+            self._export_progress = None
+        self._export_worker = None
+    
+    def _on_export_finished(self, filepath):
+        """Meldet einen erfolgreichen Export.
+        
+        Args:
+            filepath (str): Pfad der geschriebenen Datei
+        """
+        self._finish_export()
+        QMessageBox.information(self, "Export", f"Trendbericht wurde exportiert nach:\n{filepath}")
+    
+    def _on_export_error(self, message):
+        """Meldet einen fehlgeschlagenen Export.
+        
+        Args:
+            message (str): Fehlermeldung
+        """
+        self._finish_export()
+        self.logger.log_error(f"Fehler beim Exportieren: {message}")
+        QMessageBox.critical(self, "Fehler", f"Fehler beim Exportieren:\n{message}")
+
+
+def _write_csv(filepath, dates, active, zero):
+    """Schreibt die Trendreihen als CSV-Datei.
+    
+    Args:
+        filepath (str): Zieldatei
+        dates (list): Datumsangaben
+        active (numpy.ndarray): Aktive Artikel je Datum
+        zero (numpy.ndarray): Nullbestand je Datum
+    """
+    # csv.writer übernimmt Formatierung und Quoting in C
+    with open(filepath, 'w', encoding='utf-8', buffering=1 << 20, newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(CSV_HEADER)
+        writer.writerows(zip(dates, active.tolist(), zero.tolist()))
+
+
+def _write_excel(filepath, dates, active, zero):
+    """Schreibt die Trendreihen als Excel-Datei.
+    
+    Args:
+        filepath (str): Zieldatei
+        dates (list): Datumsangaben
+        active (numpy.ndarray): Aktive Artikel je Datum
+        zero (numpy.ndarray): Nullbestand je Datum
+    """
+    import pandas as pd
+    
+    df = pd.DataFrame({'Datum': dates, 'Aktive Artikel': active, 'Nullbestand': zero})
+    
+    # xlsxwriter schreibt zeilenweise auf die Platte, sonst openpyxl
+    if importlib.util.find_spec('xlsxwriter') is not None:
+        writer = pd.ExcelWriter(filepath, engine='xlsxwriter',
+                                engine_kwargs={'options': {'constant_memory': True}})
+    else:
+        writer = pd.ExcelWriter(filepath, engine='openpyxl')
+    
+    with writer:
+        df.to_excel(writer, index=False, sheet_name='Trend')
+
+
+# Exportformat -> (Schreibfunktion, Dialogtitel, Dateifilter, Anzeigename, benötigt Pandas)
+_EXPORTERS = {
+    'csv': (_write_csv, "CSV-Datei speichern", "CSV-Dateien (*.csv)", "CSV", False),
+    'excel': (_write_excel, "Excel-Datei speichern", "Excel-Dateien (*.xlsx)", "Excel", True),
+}
+
+
+class ExportWorkerSignals(QObject):
+    """Signale des ExportWorker."""
+    
+    finished = pyqtSignal(str)
+    error = pyqtSignal(str)
+
+
+class ExportWorker(QRunnable):
+    """Schreibt eine Exportdatei außerhalb des GUI-Threads."""
+    
+    def __init__(self, write, filepath):
+        """Initialisiert den Worker.
+        
+        Args:
+            write (callable): Funktion, die die Datei schreibt
+            filepath (str): Zieldatei
+        """
+        super().__init__()
+        
+        self.write = write
+        self.filepath = filepath
+        self.signals = ExportWorkerSignals()
+    
+    def run(self):
+        """Führt das Schreiben aus und meldet das Ergebnis per Signal."""
+        try:
+            self.write()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(self.filepath)
@@ -7,6 +7,8 @@ Ermöglicht die Konfiguration von Datenbankverbindungen, Scheduler und Anwendung
 """
 
 import os
+import platform
+import subprocess
 from PyQt5.QtWidgets import (QDialog, QWidget, QVBoxLayout, QHBoxLayout, 
                            QTabWidget, QLabel, QLineEdit, QPushButton, 
                            QComboBox, QSpinBox, QTimeEdit, QCheckBox,
@@ -16,6 +18,114 @@ from PyQt5.QtCore import Qt, QTime, QRegExp
 from PyQt5.QtGui import QRegExpValidator
 
 
+# Tab-Indizes in Anzeigereihenfolge
+DATABASE_TAB, SCHEDULER_TAB, REPORT_TAB, UI_TAB, LOGGING_TAB = range(5)
+
+# Konfigurationswerte in der Reihenfolge der Combobox-Einträge
+_DB_TYPES = ('mysql', 'mssql')
+_EXPORT = ('csv', 'excel', 'pdf')
+_THEMES = ('system', 'light', 'dark')
+_LANGS = ('de', 'en')
+
+# Umrechnung zwischen MB (Anzeige) und Bytes (Konfiguration)
+_BYTES_PER_MB = 1 << 20
+
+# Einmal kompiliertes Muster für die Port-Eingabe
+_PORT_RE = QRegExp(r"\d+")
+
+
+# Deklarativer Aufbau der Tabs in Tab-Reihenfolge:
+# (Tab-Titel, ((Gruppentitel, ((Beschriftung, Art, Attribut, Optionen), ...)), ...), (Button-Text, Slot) oder None)
+_SCHEMA = (
+    ("Datenbank", (
+        ("Datenbanktyp", (
+            ("Typ:", 'combo', 'db_type_combo', {'items': ("MySQL", "MSSQL")}),
+        )),
+        ("Verbindungsdetails", (
+            ("Host:", 'line', 'host_edit', {}),
+            ("Port:", 'line', 'port_edit', {'validator': _PORT_RE}),
+            ("Benutzername:", 'line', 'username_edit', {}),
+            ("Passwort:", 'line', 'password_edit', {'password': True}),
+            ("Datenbank:", 'line', 'database_edit', {}),
+        )),
+        ("Erweiterte Einstellungen", (
+            ("Verbindungs-Timeout:", 'spin', 'timeout_spin', {'range': (5, 300), 'suffix': " Sekunden"}),
+            ("Max. Verbindungen:", 'spin', 'max_connections_spin', {'range': (1, 50)}),
+        )),
+    ), ("Verbindung testen", 'test_connection')),
+    ("Scheduler", (
+        ("Zeitplaneinstellungen", (
+            ("Tägliche Abfragezeit:", 'time', 'query_time_edit', {'format': "HH:mm"}),
+        )),
+        ("Fehlerbehandlung", (
+            ("Wiederholungsversuche:", 'spin', 'retry_attempts_spin', {'range': (0, 10)}),
+            ("Wiederholungsintervall:", 'spin', 'retry_interval_spin', {'range': (1, 120), 'suffix': " Minuten"}),
+        )),
+        ("Datenaufbewahrung", (
+            ("Maximales Datenalter:", 'spin', 'max_data_age_spin', {'range': (7, 365), 'suffix': " Tage"}),
+        )),
+    ), None),
+    ("Berichte", (
+        ("Berichtseinstellungen", (
+            ("Hervorhebungsschwelle:", 'spin', 'highlight_threshold_spin', {'range': (1, 100), 'suffix': " %"}),
+            ("Historische Daten:", 'spin', 'history_days_spin', {'range': (1, 365), 'suffix': " Tage"}),
+        )),
+        ("Exporteinstellungen", (
+            ("Standard-Exportformat:", 'combo', 'export_format_combo', {'items': ("CSV", "Excel", "PDF")}),
+            ("Exportpfad:", 'path', 'export_path_edit', {'browse': 'browse_export_path'}),
+        )),
+    ), None),
+    ("Benutzeroberfläche", (
+        ("Aussehen", (
+            ("Thema:", 'combo', 'theme_combo', {'items': ("System", "Hell", "Dunkel")}),
+            ("Sprache:", 'combo', 'language_combo', {'items': ("Deutsch", "Englisch")}),
+        )),
+        ("Verhalten", (
+            ("Aktualisierungsintervall:", 'spin', 'refresh_interval_spin',
+             {'range': (0, 3600), 'suffix': " Sekunden", 'special': "Nie"}),
+        )),
+    ), None),
+    ("Logging", (
+        ("Logging-Einstellungen", (
+            ("Log-Level:", 'combo', 'log_level_combo', {'items': ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")}),
+            ("Log-Pfad:", 'path', 'log_path_edit', {'browse': 'browse_log_path'}),
+        )),
+        ("Log-Rotation", (
+            ("Maximale Log-Größe:", 'spin', 'max_log_size_spin', {'range': (1, 100), 'suffix': " MB"}),
+            ("Anzahl Backups:", 'spin', 'backup_count_spin', {'range': (1, 20)}),
+        )),
+    ), ("Log-Dateien öffnen", 'open_log_directory')),
+)
+
+
+def _add_rows(form, rows):
+    """Fügt alle Zeilen eines Formulars in einem Durchlauf hinzu.
+    
+    Args:
+        form (QFormLayout): Ziel-Layout
+        rows (iterable): Paare aus Beschriftung und Widget bzw. Layout
+    """
+    for label, field in rows:
+        form.addRow(label, field)
+
+
+def _combo_index(values, value, fallback):
+    """Ermittelt den Combobox-Index eines Konfigurationswerts.
+    
+    Args:
+        values (tuple): Konfigurationswerte in Combobox-Reihenfolge
+        value (str): Gesuchter Wert
+        fallback (int): Index für unbekannte Werte
+        
+    Returns:
+        int: Combobox-Index
+    """
+    try:
+        return values.index(value)
+    except ValueError:
+        return fallback
+
+
 class SettingsDialog(QDialog):
     """Einstellungsdialogsklasse."""
     
@@ -34,11 +144,14 @@ class SettingsDialog(QDialog):
         self.db_manager = db_manager
         self.logger = logger
         
+        # Verzeichnisauswahl, wird beim ersten Durchsuchen erstellt und danach wiederverwendet
+        self._dir_dialog = None
+        
         # UI einrichten
         self.setup_ui()
         
-        # Aktuelle Einstellungen laden
-        self.load_current_settings()
+        # Nur den sichtbaren Tab aufbauen und mit den aktuellen Einstellungen füllen
+        self._ensure_tab_built(self.tabs.currentIndex())
         
         self.logger.log_info("Einstellungsdialog initialisiert")
     
@@ -54,30 +167,22 @@ class SettingsDialog(QDialog):
         self.tabs = QTabWidget()
         main_layout.addWidget(self.tabs)
         
-        # Datenbankeinstellungen-Tab
-        db_tab = QWidget()
-        self.tabs.addTab(db_tab, "Datenbank")
-        self.setup_database_tab(db_tab)
+        # Tab-Inhalte werden erst beim ersten Anzeigen aus _SCHEMA aufgebaut und geladen
+        self._tab_loaders = {
+            DATABASE_TAB: self._load_database_settings,
+            SCHEDULER_TAB: self._load_scheduler_settings,
+            REPORT_TAB: self._load_report_settings,
+            UI_TAB: self._load_ui_settings,
+            LOGGING_TAB: self._load_logging_settings
+        }
+        self._built_tabs = set()
+        self._snapshot = {}
         
-        # Scheduler-Einstellungen-Tab
-        scheduler_tab = QWidget()
-        self.tabs.addTab(scheduler_tab, "Scheduler")
-        self.setup_scheduler_tab(scheduler_tab)
+        # Platzhalter für alle Tabs
+        for title, _, _ in _SCHEMA:
+            self.tabs.addTab(QWidget(), title)
         
-        # Berichtseinstellungen-Tab
-        report_tab = QWidget()
-        self.tabs.addTab(report_tab, "Berichte")
-        self.setup_report_tab(report_tab)
-        
-        # UI-Einstellungen-Tab
-        ui_tab = QWidget()
-        self.tabs.addTab(ui_tab, "Benutzeroberfläche")
-        self.setup_ui_tab(ui_tab)
-        
-        # Logging-Einstellungen-Tab
-        logging_tab = QWidget()
-        self.tabs.addTab(logging_tab, "Logging")
-        self.setup_logging_tab(logging_tab)
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
         
         # Buttons am unteren Rand
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel | QDialogButtonBox.Apply | QDialogButtonBox.Reset)
@@ -88,329 +193,265 @@ class SettingsDialog(QDialog):
         
         main_layout.addWidget(button_box)
     
-    def setup_database_tab(self, tab):
-        """Richtet die UI-Komponenten für den Datenbank-Tab ein.
+    def _ensure_tab_built(self, index):
+        """Baut einen Tab beim ersten Anzeigen auf und lädt seine Einstellungen.
         
         Args:
-            tab (QWidget): Tab-Widget
+            index (int): Tab-Index
         """
-        layout = QVBoxLayout(tab)
-        
-        # Datenbanktyp
-        db_type_group = QGroupBox("Datenbanktyp")
-        db_type_layout = QFormLayout(db_type_group)
-        
-        self.db_type_combo = QComboBox()
-        self.db_type_combo.addItems(["MySQL", "MSSQL"])
-        db_type_layout.addRow("Typ:", self.db_type_combo)
-        
-        layout.addWidget(db_type_group)
-        
-        # Verbindungsdetails
-        connection_group = QGroupBox("Verbindungsdetails")
-        connection_layout = QFormLayout(connection_group)
-        
-        self.host_edit = QLineEdit()
-        connection_layout.addRow("Host:", self.host_edit)
-        
-        # Port muss eine Zahl sein
-        self.port_edit = QLineEdit()
-        self.port_edit.setValidator(QRegExpValidator(QRegExp("\\d+")))
-        connection_layout.addRow("Port:", self.port_edit)
-        
-        self.username_edit = QLineEdit()
-        connection_layout.addRow("Benutzername:", self.username_edit)
-        
-        self.password_edit = QLineEdit()
-        self.password_edit.setEchoMode(QLineEdit.Password)
-        connection_layout.addRow("Passwort:", self.password_edit)
-        
-        self.database_edit = QLineEdit()
-        connection_layout.addRow("Datenbank:", self.database_edit)
-        
-        layout.addWidget(connection_group)
-        
-        # Erweiterte Einstellungen
-        advanced_group = QGroupBox("Erweiterte Einstellungen")
-        advanced_layout = QFormLayout(advanced_group)
-        
-        self.timeout_spin = QSpinBox()
-        self.timeout_spin.setRange(5, 300)
-        self.timeout_spin.setSuffix(" Sekunden")
-        advanced_layout.addRow("Verbindungs-Timeout:", self.timeout_spin)
-        
-        self.max_connections_spin = QSpinBox()
-        self.max_connections_spin.setRange(1, 50)
-        advanced_layout.addRow("Max. Verbindungen:", self.max_connections_spin)
-        
-        layout.addWidget(advanced_group)
+        if index in self._built_tabs or not 0 <= index < len(_SCHEMA):
+            return
         
-        # Test-Button
-        test_button = QPushButton("Verbindung testen")
-        test_button.clicked.connect(self.test_connection)
-        layout.addWidget(test_button)
+        tab = self.tabs.widget(index)
         
-        layout.addStretch()
+        # Layout erst nach dem Aufbau aller Gruppen einmal berechnen und zeichnen
+        tab.setUpdatesEnabled(False)
+        try:
+            self._build_tab(tab, _SCHEMA[index])
+        finally:
+            tab.setUpdatesEnabled(True)
+        self._built_tabs.add(index)
+        self.load_current_settings((index,))
     
-    def setup_scheduler_tab(self, tab):
-        """Richtet die UI-Komponenten für den Scheduler-Tab ein.
+    def _build_tab(self, tab, schema):
+        """Baut einen Tab anhand seines Schema-Eintrags auf.
         
         Args:
             tab (QWidget): Tab-Widget
+            schema (tuple): Eintrag aus _SCHEMA
         """
+        _, groups, button = schema
         layout = QVBoxLayout(tab)
         
-        # Zeitplaneinstellungen
-        time_group = QGroupBox("Zeitplaneinstellungen")
-        time_layout = QFormLayout(time_group)
-        
-        self.query_time_edit = QTimeEdit()
-        self.query_time_edit.setDisplayFormat("HH:mm")
-        time_layout.addRow("Tägliche Abfragezeit:", self.query_time_edit)
-        
-        layout.addWidget(time_group)
-        
-        # Fehlerbehandlung
-        error_group = QGroupBox("Fehlerbehandlung")
-        error_layout = QFormLayout(error_group)
-        
-        self.retry_attempts_spin = QSpinBox()
-        self.retry_attempts_spin.setRange(0, 10)
-        error_layout.addRow("Wiederholungsversuche:", self.retry_attempts_spin)
-        
-        self.retry_interval_spin = QSpinBox()
-        self.retry_interval_spin.setRange(1, 120)
-        self.retry_interval_spin.setSuffix(" Minuten")
-        error_layout.addRow("Wiederholungsintervall:", self.retry_interval_spin)
-        
-        layout.addWidget(error_group)
-        
-        # Datenaufbewahrung
-        data_group = QGroupBox("Datenaufbewahrung")
-        data_layout = QFormLayout(data_group)
-        
-        self.max_data_age_spin = QSpinBox()
-        self.max_data_age_spin.setRange(7, 365)
-        self.max_data_age_spin.setSuffix(" Tage")
-        data_layout.addRow("Maximales Datenalter:", self.max_data_age_spin)
+        for title, rows in groups:
+            group = QGroupBox(title)
+            _add_rows(QFormLayout(group), [
+                (label, self._create_field(kind, attr, options))
+                for label, kind, attr, options in rows
+            ])
+            layout.addWidget(group)
         
-        layout.addWidget(data_group)
+        if button:
+            text, slot = button
+            push_button = QPushButton(text)
+            push_button.clicked.connect(getattr(self, slot))
+            layout.addWidget(push_button)
         
         layout.addStretch()
     
-    def setup_report_tab(self, tab):
-        """Richtet die UI-Komponenten für den Bericht-Tab ein.
+    def _create_field(self, kind, attr, options):
+        """Erstellt ein Eingabefeld und legt es als Attribut des Dialogs ab.
         
         Args:
-            tab (QWidget): Tab-Widget
+            kind (str): Feldart ('line', 'spin', 'combo', 'time' oder 'path')
+            attr (str): Attributname, unter dem das Widget abgelegt wird
+            options (dict): Feldoptionen aus dem Schema
+            
+        Returns:
+            QWidget|QLayout: Widget bzw. Layout für die Formularzeile
         """
-        layout = QVBoxLayout(tab)
-        
-        # Berichtseinstellungen
-        report_group = QGroupBox("Berichtseinstellungen")
-        report_layout = QFormLayout(report_group)
-        
-        self.highlight_threshold_spin = QSpinBox()
-        self.highlight_threshold_spin.setRange(1, 100)
-        self.highlight_threshold_spin.setSuffix(" %")
-        report_layout.addRow("Hervorhebungsschwelle:", self.highlight_threshold_spin)
-        
-        self.history_days_spin = QSpinBox()
-        self.history_days_spin.setRange(1, 365)
-        self.history_days_spin.setSuffix(" Tage")
-        report_layout.addRow("Historische Daten:", self.history_days_spin)
-        
-        layout.addWidget(report_group)
-        
-        # Exporteinstellungen
-        export_group = QGroupBox("Exporteinstellungen")
-        export_layout = QFormLayout(export_group)
-        
-        self.export_format_combo = QComboBox()
-        self.export_format_combo.addItems(["CSV", "Excel", "PDF"])
-        export_layout.addRow("Standard-Exportformat:", self.export_format_combo)
-        
-        self.export_path_edit = QLineEdit()
-        self.export_path_edit.setReadOnly(True)
+        if kind == 'spin':
+            widget = QSpinBox()
+            widget.setRange(*options['range'])
+            if 'suffix' in options:
+                widget.setSuffix(options['suffix'])
+            if 'special' in options:
+                widget.setSpecialValueText(options['special'])
+        elif kind == 'combo':
+            widget = QComboBox()
+            widget.addItems(options['items'])
+        elif kind == 'time':
+            widget = QTimeEdit()
+            widget.setDisplayFormat(options['format'])
+        else:
+            widget = QLineEdit()
+            if 'validator' in options:
+                widget.setValidator(QRegExpValidator(options['validator'], self))
+            if options.get('password'):
+                widget.setEchoMode(QLineEdit.Password)
+        
+        setattr(self, attr, widget)
+        
+        if kind != 'path':
+            return widget
+        
+        # Pfadfeld: schreibgeschützt mit Button zur Verzeichnisauswahl
+        widget.setReadOnly(True)
         
         path_layout = QHBoxLayout()
-        path_layout.addWidget(self.export_path_edit)
+        path_layout.addWidget(widget)
         
         browse_button = QPushButton("...")
         browse_button.setMaximumWidth(30)
-        browse_button.clicked.connect(self.browse_export_path)
+        browse_button.clicked.connect(getattr(self, options['browse']))
         path_layout.addWidget(browse_button)
         
-        export_layout.addRow("Exportpfad:", path_layout)
-        
-        layout.addWidget(export_group)
-        
-        layout.addStretch()
+        return path_layout
     
-    def setup_ui_tab(self, tab):
-        """Richtet die UI-Komponenten für den UI-Tab ein.
+    def load_current_settings(self, tabs=None):
+        """Lädt aktuelle Einstellungen.
         
         Args:
-            tab (QWidget): Tab-Widget
+            tabs (iterable, optional): Zu ladende Tab-Indizes (Standard: alle aufgebauten Tabs)
         """
-        layout = QVBoxLayout(tab)
-        
-        # Thema
-        theme_group = QGroupBox("Aussehen")
-        theme_layout = QFormLayout(theme_group)
+        indices = sorted(self._built_tabs if tabs is None else tabs)
         
-        self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["System", "Hell", "Dunkel"])
-        theme_layout.addRow("Thema:", self.theme_combo)
+        # Signale und Neuzeichnen während des Befüllens unterdrücken,
+        # damit nur einmal am Ende aktualisiert wird
+        widgets = [widget for index in indices
+                   for widget in self.tabs.widget(index).findChildren(QWidget)]
+        self.setUpdatesEnabled(False)
+        for widget in widgets:
+            widget.blockSignals(True)
         
-        self.language_combo = QComboBox()
-        self.language_combo.addItems(["Deutsch", "Englisch"])
-        theme_layout.addRow("Sprache:", self.language_combo)
+        try:
+            for index in indices:
+                self._tab_loaders[index]()
+            
+            # Geladenen Stand merken, um beim Speichern Änderungen zu erkennen
+            self._snapshot.update(self._collect_widget_values(indices))
+            
+        except Exception as e:
+            self.logger.log_error(f"Fehler beim Laden der Einstellungen: {str(e)}", exc_info=True)
+            QMessageBox.critical(self, "Fehler", f"Fehler beim Laden der Einstellungen:\n{str(e)}")
+            
+        finally:
+            for widget in widgets:
+                widget.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.update()
+    
+    def _load_database_settings(self):
+        """Lädt die Datenbankeinstellungen in den Datenbank-Tab."""
+        db = self.config.get_section('Database')
         
-        layout.addWidget(theme_group)
+        db_type = db.get('type', 'mysql').lower()
+        self.db_type_combo.setCurrentIndex(_combo_index(_DB_TYPES, db_type, 1))
         
-        # Verhalten
-        behavior_group = QGroupBox("Verhalten")
-        behavior_layout = QFormLayout(behavior_group)
+        self.host_edit.setText(db.get('host', 'localhost'))
+        self.port_edit.setText(db.get('port', '3306'))
+        self.username_edit.setText(db.get('username', ''))
+        self.password_edit.setText(db.get('password', ''))
+        self.database_edit.setText(db.get('database', ''))
         
-        self.refresh_interval_spin = QSpinBox()
-        self.refresh_interval_spin.setRange(0, 3600)
-        self.refresh_interval_spin.setSuffix(" Sekunden")
-        self.refresh_interval_spin.setSpecialValueText("Nie")
-        behavior_layout.addRow("Aktualisierungsintervall:", self.refresh_interval_spin)
+        self.timeout_spin.setValue(int(db.get('connection_timeout', '30')))
+        self.max_connections_spin.setValue(int(db.get('max_connections', '5')))
+    
+    def _load_scheduler_settings(self):
+        """Lädt die Scheduler-Einstellungen in den Scheduler-Tab."""
+        scheduler = self.config.get_section('Scheduler')
         
-        layout.addWidget(behavior_group)
+        # Qt parst die Uhrzeit direkt, ohne split() und zwei int()-Aufrufe
+        query_time = QTime.fromString(scheduler.get('query_time', '23:00'), 'H:m')
+        self.query_time_edit.setTime(query_time if query_time.isValid() else QTime(23, 0))
         
-        layout.addStretch()
+        self.retry_attempts_spin.setValue(int(scheduler.get('retry_attempts', '3')))
+        self.retry_interval_spin.setValue(int(scheduler.get('retry_interval', '10')))
+        self.max_data_age_spin.setValue(int(scheduler.get('max_data_age', '90')))
     
-    def setup_logging_tab(self, tab):
-        """Richtet die UI-Komponenten für den Logging-Tab ein.
+    def _load_report_settings(self):
+        """Lädt die Berichtseinstellungen in den Bericht-Tab."""
+        report = self.config.get_section('Report')
         
-        Args:
-            tab (QWidget): Tab-Widget
-        """
-        layout = QVBoxLayout(tab)
+        self.highlight_threshold_spin.setValue(int(report.get('highlight_threshold', '10')))
+        self.history_days_spin.setValue(int(report.get('history_days', '30')))
         
-        # Logging-Einstellungen
-        log_group = QGroupBox("Logging-Einstellungen")
-        log_layout = QFormLayout(log_group)
+        export_format = report.get('default_export_format', 'excel').lower()
+        self.export_format_combo.setCurrentIndex(_combo_index(_EXPORT, export_format, 2))
         
-        self.log_level_combo = QComboBox()
-        self.log_level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
-        log_layout.addRow("Log-Level:", self.log_level_combo)
+        self.export_path_edit.setText(report.get('export_path', './reports'))
+    
+    def _load_ui_settings(self):
+        """Lädt die UI-Einstellungen in den UI-Tab."""
+        ui = self.config.get_section('UI')
         
-        self.log_path_edit = QLineEdit()
-        self.log_path_edit.setReadOnly(True)
+        theme = ui.get('theme', 'system').lower()
+        self.theme_combo.setCurrentIndex(_combo_index(_THEMES, theme, 0))
         
-        path_layout = QHBoxLayout()
-        path_layout.addWidget(self.log_path_edit)
+        language = ui.get('language', 'de').lower()
+        self.language_combo.setCurrentIndex(_combo_index(_LANGS, language, 0))
         
-        browse_button = QPushButton("...")
-        browse_button.setMaximumWidth(30)
-        browse_button.clicked.connect(self.browse_log_path)
-        path_layout.addWidget(browse_button)
+        self.refresh_interval_spin.setValue(int(ui.get('refresh_interval', '300')))
+    
+    def _load_logging_settings(self):
+        """Lädt die Logging-Einstellungen in den Logging-Tab."""
+        logging_cfg = self.config.get_section('Logging')
         
-        log_layout.addRow("Log-Pfad:", path_layout)
+        log_level = logging_cfg.get('level', 'INFO').upper()
+        log_level_index = self.log_level_combo.findText(log_level)
+        if log_level_index >= 0:
+            self.log_level_combo.setCurrentIndex(log_level_index)
         
-        layout.addWidget(log_group)
+        self.log_path_edit.setText(logging_cfg.get('log_path', './logs'))
         
-        # Rotation
-        rotation_group = QGroupBox("Log-Rotation")
-        rotation_layout = QFormLayout(rotation_group)
+        max_log_size = self.config.get_int('Logging', 'max_log_size', 10 * _BYTES_PER_MB)
+        self.max_log_size_spin.setValue(max_log_size >> 20)  # Von Bytes in MB
         
-        self.max_log_size_spin = QSpinBox()
-        self.max_log_size_spin.setRange(1, 100)
-        self.max_log_size_spin.setSuffix(" MB")
-        rotation_layout.addRow("Maximale Log-Größe:", self.max_log_size_spin)
+        self.backup_count_spin.setValue(int(logging_cfg.get('backup_count', '5')))
+    
+    def _collect_widget_values(self, tabs=None):
+        """Liest die Werte der aufgebauten Tabs im Konfigurationsformat aus.
         
-        self.backup_count_spin = QSpinBox()
-        self.backup_count_spin.setRange(1, 20)
-        rotation_layout.addRow("Anzahl Backups:", self.backup_count_spin)
+        Nicht aufgebaute Tabs wurden nicht verändert und werden übersprungen.
         
-        layout.addWidget(rotation_group)
+        Args:
+            tabs (iterable, optional): Auszulesende Tab-Indizes (Standard: alle aufgebauten Tabs)
+            
+        Returns:
+            dict: Zuordnung Sektion -> {Schlüssel: Wert}
+        """
+        tabs = self._built_tabs if tabs is None else tabs
+        values = {}
+        
+        # Datenbankeinstellungen
+        if DATABASE_TAB in tabs:
+            values['Database'] = {
+                'type': _DB_TYPES[self.db_type_combo.currentIndex()],
+                'host': self.host_edit.text(),
+                'port': self.port_edit.text(),
+                'username': self.username_edit.text(),
+                'password': self.password_edit.text(),
+                'database': self.database_edit.text(),
+                'connection_timeout': str(self.timeout_spin.value()),
+                'max_connections': str(self.max_connections_spin.value())
+            }
+        
+        # Scheduler-Einstellungen
+        if SCHEDULER_TAB in tabs:
+            values['Scheduler'] = {
+                'query_time': self.query_time_edit.time().toString('HH:mm'),
+                'retry_attempts': str(self.retry_attempts_spin.value()),
+                'retry_interval': str(self.retry_interval_spin.value()),
+                'max_data_age': str(self.max_data_age_spin.value())
+            }
         
-        # Öffnen-Button
-        open_log_button = QPushButton("Log-Dateien öffnen")
-        open_log_button.clicked.connect(self.open_log_directory)
-        layout.addWidget(open_log_button)
+        # Berichtseinstellungen
+        if REPORT_TAB in tabs:
+            values['Report'] = {
+                'highlight_threshold': str(self.highlight_threshold_spin.value()),
+                'history_days': str(self.history_days_spin.value()),
+                'default_export_format': _EXPORT[self.export_format_combo.currentIndex()],
+                'export_path': self.export_path_edit.text()
+            }
+        
+        # UI-Einstellungen
+        if UI_TAB in tabs:
+            values['UI'] = {
+                'theme': _THEMES[self.theme_combo.currentIndex()],
+                'language': _LANGS[self.language_combo.currentIndex()],
+                'refresh_interval': str(self.refresh_interval_spin.value())
+            }
         
-        layout.addStretch()
-    
-    def load_current_settings(self):
-        """Lädt aktuelle Einstellungen."""
-        try:
-            # Datenbankeinstellungen
-            db_type = self.config.get_value('Database', 'type', 'mysql').lower()
-            if db_type == 'mysql':
-                self.db_type_combo.setCurrentIndex(0)
-            else:
-                self.db_type_combo.setCurrentIndex(1)
-            
-            self.host_edit.setText(self.config.get_value('Database', 'host', 'localhost'))
-            self.port_edit.setText(self.config.get_value('Database', 'port', '3306'))
-            self.username_edit.setText(self.config.get_value('Database', 'username', ''))
-            self.password_edit.setText(self.config.get_value('Database', 'password', ''))
-            self.database_edit.setText(self.config.get_value('Database', 'database', ''))
-            
-            self.timeout_spin.setValue(int(self.config.get_value('Database', 'connection_timeout', '30')))
-            self.max_connections_spin.setValue(int(self.config.get_value('Database', 'max_connections', '5')))
-            
-            # Scheduler-Einstellungen
-            query_time_str = self.config.get_value('Scheduler', 'query_time', '23:00')
-            hour, minute = map(int, query_time_str.split(':'))
-            self.query_time_edit.setTime(QTime(hour, minute))
-            
-            self.retry_attempts_spin.setValue(int(self.config.get_value('Scheduler', 'retry_attempts', '3')))
-            self.retry_interval_spin.setValue(int(self.config.get_value('Scheduler', 'retry_interval', '10')))
-            self.max_data_age_spin.setValue(int(self.config.get_value('Scheduler', 'max_data_age', '90')))
-            
-            # Berichtseinstellungen
-            self.highlight_threshold_spin.setValue(int(self.config.get_value('Report', 'highlight_threshold', '10')))
-            self.history_days_spin.setValue(int(self.config.get_value('Report', 'history_days', '30')))
-            
-            export_format = self.config.get_value('Report', 'default_export_format', 'excel').lower()
-            if export_format == 'csv':
-                self.export_format_combo.setCurrentIndex(0)
-            elif export_format == 'excel':
-                self.export_format_combo.setCurrentIndex(1)
-            else:
-                self.export_format_combo.setCurrentIndex(2)
-            
-            self.export_path_edit.setText(self.config.get_value('Report', 'export_path', './reports'))
-            
-            # UI-Einstellungen
-            theme = self.config.get_value('UI', 'theme', 'system').lower()
-            if theme == 'light':
-                self.theme_combo.setCurrentIndex(1)
-            elif theme == 'dark':
-                self.theme_combo.setCurrentIndex(2)
-            else:
-                self.theme_combo.setCurrentIndex(0)
-            
-            language = self.config.get_value('UI', 'language', 'de').lower()
-            if language == 'en':
-                self.language_combo.setCurrentIndex(1)
-            else:
-                self.language_combo.setCurrentIndex(0)
-            
-            self.refresh_interval_spin.setValue(int(self.config.get_value('UI', 'refresh_interval', '300')))
-            
-            # Logging-Einstellungen
-            log_level = self.config.get_value('Logging', 'level', 'INFO').upper()
-            log_level_index = self.log_level_combo.findText(log_level)
-            if log_level_index >= 0:
-                self.log_level_combo.setCurrentIndex(log_level_index)
-            
-            self.log_path_edit.setText(self.config.get_value('Logging', 'log_path', './logs'))
-            
-            max_log_size = int(self.config.get_value('Logging', 'max_log_size', '10485760'))
-            self.max_log_size_spin.setValue(max_log_size // 1048576)  # Von Bytes in MB
-            
-            self.backup_count_spin.setValue(int(self.config.get_value('Logging', 'backup_count', '5')))
-            
-        except Exception as e:
-            self.logger.log_error(f"Fehler beim Laden der Einstellungen: {str(e)}", exc_info=True)
-            QMessageBox.critical(self, "Fehler", f"Fehler beim Laden der Einstellungen:\n{str(e)}")
+        # Logging-Einstellungen
+        if LOGGING_TAB in tabs:
+            values['Logging'] = {
+                'level': self.log_level_combo.currentText(),
+                'log_path': self.log_path_edit.text(),
+                'max_log_size': str(self.max_log_size_spin.value() << 20),  # Von MB in Bytes
+                'backup_count': str(self.backup_count_spin.value())
+            }
+        
+        return values
     
     def save_settings(self):
         """Speichert Einstellungen.
@@ -419,55 +460,24 @@ class SettingsDialog(QDialog):
             bool: True bei Erfolg, sonst False
         """
         try:
-            # Datenbankeinstellungen
-            db_type = 'mysql' if self.db_type_combo.currentIndex() == 0 else 'mssql'
-            self.config.set_value('Database', 'type', db_type)
-            self.config.set_value('Database', 'host', self.host_edit.text())
-            self.config.set_value('Database', 'port', self.port_edit.text())
-            self.config.set_value('Database', 'username', self.username_edit.text())
-            self.config.set_value('Database', 'password', self.password_edit.text())
-            self.config.set_value('Database', 'database', self.database_edit.text())
-            self.config.set_value('Database', 'connection_timeout', str(self.timeout_spin.value()))
-            self.config.set_value('Database', 'max_connections', str(self.max_connections_spin.value()))
-            
-            # Scheduler-Einstellungen
-            query_time = self.query_time_edit.time().toString('HH:mm')
-            self.config.set_value('Scheduler', 'query_time', query_time)
-            self.config.set_value('Scheduler', 'retry_attempts', str(self.retry_attempts_spin.value()))
-            self.config.set_value('Scheduler', 'retry_interval', str(self.retry_interval_spin.value()))
-            self.config.set_value('Scheduler', 'max_data_age', str(self.max_data_age_spin.value()))
-            
-            # Berichtseinstellungen
-            self.config.set_value('Report', 'highlight_threshold', str(self.highlight_threshold_spin.value()))
-            self.config.set_value('Report', 'history_days', str(self.history_days_spin.value()))
-            
-            export_format_index = self.export_format_combo.currentIndex()
-            export_format = 'csv' if export_format_index == 0 else 'excel' if export_format_index == 1 else 'pdf'
-            self.config.set_value('Report', 'default_export_format', export_format)
-            
-            self.config.set_value('Report', 'export_path', self.export_path_edit.text())
-            
-            # UI-Einstellungen
-            theme_index = self.theme_combo.currentIndex()
-            theme = 'system' if theme_index == 0 else 'light' if theme_index == 1 else 'dark'
-            self.config.set_value('UI', 'theme', theme)
-            
-            language = 'de' if self.language_combo.currentIndex() == 0 else 'en'
-            self.config.set_value('UI', 'language', language)
+            current = self._collect_widget_values()
             
-            self.config.set_value('UI', 'refresh_interval', str(self.refresh_interval_spin.value()))
+            # Nur tatsächlich geänderte Werte übernehmen
+            changes = {}
+            for section, values in current.items():
+                snapshot = self._snapshot.get(section, {})
+                changed = {key: value for key, value in values.items() if snapshot.get(key) != value}
+                if changed:
+                    changes[section] = changed
             
-            # Logging-Einstellungen
-            self.config.set_value('Logging', 'level', self.log_level_combo.currentText())
-            self.config.set_value('Logging', 'log_path', self.log_path_edit.text())
-            
-            max_log_size_bytes = self.max_log_size_spin.value() * 1048576  # Von MB in Bytes
-            self.config.set_value('Logging', 'max_log_size', str(max_log_size_bytes))
-            
-            self.config.set_value('Logging', 'backup_count', str(self.backup_count_spin.value()))
+            if not changes:
+                self.logger.log_info("Keine Änderungen an den Einstellungen")
+                return True
             
-            # Konfiguration speichern
-            if self.config.save_config():
+            # Konfiguration in einem Durchlauf übernehmen und speichern
+            if self.config.update_many(changes) and self.config.save_config():
+                for section, values in current.items():
+                    self._snapshot[section] = values
                 self.logger.log_info("Einstellungen erfolgreich gespeichert")
                 return True
             else:
@@ -487,31 +497,19 @@ class SettingsDialog(QDialog):
     
     def test_connection(self):
         """Testet die Datenbankverbindung."""
-        # Temporäre Einstellungen übernehmen
-        original_type = self.config.get_value('Database', 'type')
-        original_host = self.config.get_value('Database', 'host')
-        original_port = self.config.get_value('Database', 'port')
-        original_username = self.config.get_value('Database', 'username')
-        original_password = self.config.get_value('Database', 'password')
-        original_database = self.config.get_value('Database', 'database')
-        
         try:
-            # Temporäre Einstellungen setzen
-            self.config.set_value('Database', 'type', 'mysql' if self.db_type_combo.currentIndex() == 0 else 'mssql')
-            self.config.set_value('Database', 'host', self.host_edit.text())
-            self.config.set_value('Database', 'port', self.port_edit.text())
-            self.config.set_value('Database', 'username', self.username_edit.text())
-            self.config.set_value('Database', 'password', self.password_edit.text())
-            self.config.set_value('Database', 'database', self.database_edit.text())
+            # Eingaben direkt prüfen, ohne Konfiguration oder aktive Verbindung zu verändern
+            success = self.db_manager.try_connect(
+                _DB_TYPES[self.db_type_combo.currentIndex()],
+                self.host_edit.text(),
+                self.port_edit.text(),
+                self.username_edit.text(),
+                self.password_edit.text(),
+                self.database_edit.text(),
+                self.timeout_spin.value()
+            )
             
-            # Verbindung neu initialisieren
-            if self.db_type_combo.currentIndex() == 0:
-                self.db_manager.connect_mysql()
-            else:
-                self.db_manager.connect_mssql()
-            
-            # Verbindung testen
-            if self.db_manager.test_connection():
+            if success:
                 QMessageBox.information(self, "Verbindungstest", "Die Verbindung zur Datenbank war erfolgreich.")
             else:
                 QMessageBox.warning(self, "Verbindungstest", "Die Verbindung zur Datenbank konnte nicht hergestellt werden.")
@@ -519,21 +517,6 @@ class SettingsDialog(QDialog):
         except Exception as e:
             self.logger.log_error(f"Fehler beim Testen der Datenbankverbindung: {str(e)}", exc_info=True)
             QMessageBox.critical(self, "Fehler", f"Fehler beim Testen der Datenbankverbindung:\n{str(e)}")
-            
-        finally:
-            # Ursprüngliche Einstellungen wiederherstellen
-            self.config.set_value('Database', 'type', original_type)
-            self.config.set_value('Database', 'host', original_host)
-            self.config.set_value('Database', 'port', original_port)
-            self.config.set_value('Database', 'username', original_username)
-            self.config.set_value('Database', 'password', original_password)
-            self.config.set_value('Database', 'database', original_database)
-            
-            # Verbindung wiederherstellen
-            if original_type.lower() == 'mysql':
-                self.db_manager.connect_mysql()
-            else:
-                self.db_manager.connect_mssql()
     
     def reset_defaults(self):
         """Setzt auf Standardeinstellungen zurück."""
@@ -554,27 +537,36 @@ class SettingsDialog(QDialog):
                 self.logger.log_error(f"Fehler beim Zurücksetzen der Einstellungen: {str(e)}", exc_info=True)
                 QMessageBox.critical(self, "Fehler", f"Fehler beim Zurücksetzen der Einstellungen:\n{str(e)}")
     
+    def _browse_directory(self, edit, title):
+        """Lässt ein Verzeichnis auswählen und überträgt es in ein Eingabefeld.
+        
+        Args:
+            edit (QLineEdit): Eingabefeld mit dem aktuellen Pfad
+            title (str): Fenstertitel des Auswahldialogs
+        """
+        if self._dir_dialog is None:
+            self._dir_dialog = QFileDialog(self)
+            self._dir_dialog.setFileMode(QFileDialog.Directory)
+            self._dir_dialog.setOption(QFileDialog.ShowDirsOnly, True)
+        
+        self._dir_dialog.setWindowTitle(title)
+        self._dir_dialog.setDirectory(edit.text())
+        
+        if self._dir_dialog.exec_():
+            directories = self._dir_dialog.selectedFiles()
+            if directories:
+                edit.setText(directories[0])
+    
     def browse_export_path(self):
         """Öffnet einen Dialog zum Auswählen des Exportpfads."""
-        current_path = self.export_path_edit.text()
-        directory = QFileDialog.getExistingDirectory(self, "Exportpfad auswählen", current_path)
-        
-        if directory:
-            self.export_path_edit.setText(directory)
+        self._browse_directory(self.export_path_edit, "Exportpfad auswählen")
     
     def browse_log_path(self):
         """Öffnet einen Dialog zum Auswählen des Log-Pfads."""
-        current_path = self.log_path_edit.text()
-        directory = QFileDialog.getExistingDirectory(self, "Log-Pfad auswählen", current_path)
-        
-        if directory:
-            self.log_path_edit.setText(directory)
+        self._browse_directory(self.log_path_edit, "Log-Pfad auswählen")
     
     def open_log_directory(self):
         """Öffnet das Log-Verzeichnis im Dateimanager."""
-        import subprocess
-        import platform
-        
         log_path = self.log_path_edit.text()
         
         if not os.path.exists(log_path):
@@ -582,9 +574,10 @@ class SettingsDialog(QDialog):
             return
         
         try:
-            if platform.system() == 'Windows':
+            sysname = platform.system()
+            if sysname == 'Windows':
                 os.startfile(log_path)
-            elif platform.system() == 'Darwin':  # macOS
+            elif sysname == 'Darwin':  # macOS
                 subprocess.Popen(['open', log_path])
             else:  # Linux und andere
                 subprocess.Popen(['xdg-open', log_path])
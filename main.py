@@ -8,15 +8,12 @@ Initialisiert die Anwendungskomponenten und startet die GUI.
 
 import sys
 import os
+import signal
 import argparse
+import threading
 from datetime import datetime
 
-# GUI-Imports
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import QSettings
-
-# Anwendungsimports
-from gui.main_window import MainWindow
+# Anwendungsimports (GUI-Module werden erst in start_gui geladen)
 from utils.logger import Logger
 from utils.config_manager import ConfigManager
 from scheduler.task_scheduler import TaskScheduler
@@ -33,18 +30,19 @@ def setup_logging(config):
     Returns:
         Logger: Konfigurierte Logger-Instanz
     """
-    log_level = config.get_value('Logging', 'level', 'INFO')
-    log_path = config.get_value('Logging', 'log_path', './logs')
-    max_log_size = int(config.get_value('Logging', 'max_log_size', '10485760'))
-    backup_count = int(config.get_value('Logging', 'backup_count', '5'))
-    
-    # Stellen Sie sicher, dass das Log-Verzeichnis existiert
-    os.makedirs(log_path, exist_ok=True)
-    
-    logger = Logger(log_level, log_path, max_log_size, backup_count)
-    logger.setup_logging()
+    logging_cfg = config.get_section('Logging', {
+        'level': 'INFO',
+        'log_path': './logs',
+        'max_log_size': '10485760',
+        'backup_count': '5'
+    })
+    log_level = logging_cfg['level']
+    log_path = logging_cfg['log_path']
+    max_log_size = int(logging_cfg['max_log_size'])
+    backup_count = int(logging_cfg['backup_count'])
     
-    return logger
+    # Das Log-Verzeichnis legt der Logger beim ersten Log-Aufruf an
+    return Logger.get(log_level, log_path, max_log_size, backup_count)
 
 
 def load_config():
@@ -109,18 +107,24 @@ def start_gui(db_manager, inventory_tracker, task_scheduler, config, logger):
     """
     logger.log_info("Starte GUI...")
     
+    # PyQt5 und das Hauptfenster erst hier laden, damit der Headless-Modus ohne sie auskommt
+    from PyQt5.QtWidgets import QApplication
+    from gui.main_window import MainWindow
+    
     app = QApplication(sys.argv)
     app.setApplicationName("Artikel-Tracker")
     app.setOrganizationName("IhreOrganisation")
     
+    ui_cfg = config.get_section('UI', {'theme': 'system', 'language': 'de'})
+    
     # GUI-Thema basierend auf Konfiguration setzen
-    theme = config.get_value('UI', 'theme', 'system')
+    theme = ui_cfg['theme']
     if theme == 'dark':
         app.setStyle("Fusion")
         # Hier könnte ein dunkles Theme angewendet werden
     
     # Sprache basierend auf Konfiguration setzen
-    language = config.get_value('UI', 'language', 'de')
+    language = ui_cfg['language']
     # Hier könnte die Anwendungssprache gesetzt werden
     
     # Hauptfenster erstellen und anzeigen
@@ -179,18 +183,25 @@ def main():
         else:
             # Im Headless-Modus einfach warten, bis der Scheduler die Aufgabe ausführt
             logger.log_info("Anwendung läuft im Headless-Modus. Drücken Sie Strg+C zum Beenden.")
-            try:
-                # Blockieren, bis der Benutzer die Anwendung beendet
-                import time
-                while True:
-                    time.sleep(1)
-            except KeyboardInterrupt:
-                logger.log_info("Anwendung durch Benutzer beendet.")
-                task_scheduler.stop_scheduler()
+            
+            # Warten, bis SIGINT oder SIGTERM eintrifft; mit Timeout, damit die
+            # Signal-Handler auch unter Windows zwischendurch ausgeführt werden
+            stop_event = threading.Event()
+            signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+            signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+            while not stop_event.wait(1.0):
+                pass
+            
+            logger.log_info("Anwendung durch Benutzer beendet.")
+            task_scheduler.stop_scheduler()
     
     except Exception as e:
         logger.log_error(f"Fehler bei der Anwendungsinitialisierung: {str(e)}")
         sys.exit(1)
+    
+    finally:
+        # Ausstehende Log-Einträge schreiben und Logging-Thread beenden
+        logger.shutdown()
 
 
 if __name__ == "__main__":
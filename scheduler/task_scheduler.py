@@ -6,11 +6,13 @@ Task-Scheduler für die Artikel-Tracking-Anwendung.
 Verantwortlich für die Planung und Ausführung von zeitgesteuerten Aufgaben.
 """
 
-import time
+import random
+import itertools
 from datetime import datetime, timedelta
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.triggers.cron import CronTrigger
-from apscheduler.triggers.interval import IntervalTrigger
+from apscheduler.triggers.date import DateTrigger
 from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED
 
 
@@ -30,18 +32,31 @@ class TaskScheduler:
         self.logger = logger
         
         # Wiederholungseinstellungen aus Konfiguration laden
-        self.retry_attempts = int(self.config.get_value('Scheduler', 'retry_attempts', '3'))
-        self.retry_interval = int(self.config.get_value('Scheduler', 'retry_interval', '10'))
-        
-        # Scheduler initialisieren
-        self.scheduler = BackgroundScheduler()
+        self.retry_attempts = self.config.get_int('Scheduler', 'retry_attempts', 3)
+        self.retry_interval = self.config.get_int('Scheduler', 'retry_interval', 10)
+        self.retry_interval_max = self.config.get_int('Scheduler', 'retry_interval_max', 120)
+        
+        # Scheduler initialisieren: eine tägliche Aufgabe plus gelegentliche
+        # Wiederholungen brauchen keinen Pool mit zehn Threads
+        scheduler_options = {
+            'executors': {'default': ThreadPoolExecutor(max_workers=2)},
+            'job_defaults': {'coalesce': True, 'max_instances': 1, 'misfire_grace_time': 3600}
+        }
+        timezone = self.config.get_value('Scheduler', 'timezone')
+        if timezone:
+            scheduler_options['timezone'] = timezone
+        
+        self.scheduler = BackgroundScheduler(**scheduler_options)
         self.scheduler.add_listener(self._handle_job_event, 
                                    EVENT_JOB_ERROR | EVENT_JOB_EXECUTED)
         self.scheduler.start()
         
         # Aufgaben-Status
         self.current_task_id = None
-        self.task_failures = {}
+        self._task_counter = itertools.count(1)
+        
+        # Fehlschläge in Folge, über alle Wiederholungen einer Ausführung hinweg
+        self._retry_count = 0
         
         self.logger.log_info("Task-Scheduler initialisiert")
     
@@ -66,7 +81,7 @@ class TaskScheduler:
                 replace_existing=True
             )
             
-            self.logger.log_info(f"Tägliche Aufgabe geplant für {time_str} Uhr")
+            self.logger.log_info("Tägliche Aufgabe geplant für %s Uhr", time_str)
             return job.id
         
         except Exception as e:
@@ -80,7 +95,7 @@ class TaskScheduler:
             bool: True bei erfolgreicher Ausführung, sonst False
         """
         self.logger.log_info("Führe geplante Aufgabe aus...")
-        task_id = f"task_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        task_id = f"task_{next(self._task_counter)}"
         self.current_task_id = task_id
         
         try:
@@ -88,6 +103,8 @@ class TaskScheduler:
             result = self.inventory_tracker.track_daily_inventory()
             
             if result:
+                # Fehlschläge vorheriger Versuche sind mit dem Erfolg erledigt
+                self._retry_count = 0
                 self.logger.log_info("Aufgabe erfolgreich ausgeführt")
                 self.notify_task_status(task_id, "success")
                 return True
@@ -108,14 +125,11 @@ class TaskScheduler:
             task_id (str): ID der fehlgeschlagenen Aufgabe
         """
         # Fehlschlag protokollieren
-        if task_id not in self.task_failures:
-            self.task_failures[task_id] = 0
-        
-        self.task_failures[task_id] += 1
-        current_attempt = self.task_failures[task_id]
+        self._retry_count += 1
+        current_attempt = self._retry_count
         
         self.logger.log_warning(
-            f"Aufgabe {task_id} fehlgeschlagen. Versuch {current_attempt}/{self.retry_attempts}"
+            "Aufgabe %s fehlgeschlagen. Versuch %s/%s", task_id, current_attempt, self.retry_attempts
         )
         
         # Nochmal versuchen, wenn maximale Versuche nicht erreicht
@@ -123,9 +137,10 @@ class TaskScheduler:
             self.retry_failed_task(task_id)
         else:
             self.logger.log_error(
-                f"Aufgabe {task_id} endgültig fehlgeschlagen nach {self.retry_attempts} Versuchen"
+                "Aufgabe %s endgültig fehlgeschlagen nach %s Versuchen", task_id, self.retry_attempts
             )
             self.notify_task_status(task_id, "failed")
+            self._retry_count = 0
     
     def retry_failed_task(self, task_id):
         """Wiederholt eine fehlgeschlagene Aufgabe.
@@ -133,17 +148,21 @@ class TaskScheduler:
         Args:
             task_id (str): ID der zu wiederholenden Aufgabe
         """
-        current_attempt = self.task_failures[task_id]
-        wait_time = self.retry_interval * current_attempt  # Progressives Warten
+        current_attempt = self._retry_count
+        # Exponentielles Warten mit Streuung, nach oben begrenzt
+        wait_time = min(
+            self.retry_interval * (2 ** (current_attempt - 1)) * random.uniform(0.8, 1.2),
+            self.retry_interval_max
+        )
         
         self.logger.log_info(
-            f"Plane Wiederholung für Aufgabe {task_id} in {wait_time} Minuten"
+            "Plane Wiederholung für Aufgabe %s in %.1f Minuten", task_id, wait_time
         )
         
         # Einmalige Aufgabe für Wiederholung planen
         self.scheduler.add_job(
             self.execute_task,
-            IntervalTrigger(minutes=wait_time, start_date=datetime.now()),
+            DateTrigger(run_date=datetime.now() + timedelta(minutes=wait_time)),
             id=f"retry_{task_id}_{current_attempt}",
             replace_existing=True
         )
@@ -156,10 +175,10 @@ class TaskScheduler:
         """
         if event.code == EVENT_JOB_ERROR:
             self.logger.log_error(
-                f"Fehler bei Job {event.job_id}: {str(event.exception)}"
+                "Fehler bei Job %s: %s", event.job_id, event.exception
             )
         elif event.code == EVENT_JOB_EXECUTED:
-            self.logger.log_debug(f"Job {event.job_id} ausgeführt")
+            self.logger.log_debug("Job %s ausgeführt", event.job_id)
     
     def notify_task_status(self, task_id, status):
         """Benachrichtigt über Aufgabenstatus.
@@ -168,7 +187,7 @@ class TaskScheduler:
             task_id (str): Aufgaben-ID
             status (str): Status ("success", "failed", "retry")
         """
-        self.logger.log_info(f"Aufgabenstatus für {task_id}: {status}")
+        self.logger.log_info("Aufgabenstatus für %s: %s", task_id, status)
         
         # Hier könnten Benachrichtigungen implementiert werden
         # z.B. E-Mail-Versand, Desktop-Benachrichtigungen etc.
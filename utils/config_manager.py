@@ -6,8 +6,102 @@ Konfigurationsmanager für die Artikel-Tracking-Anwendung.
 Verantwortlich für das Laden, Speichern und Verwalten von Anwendungseinstellungen.
 """
 
+import io
 import os
+import json
 import configparser
+from functools import lru_cache
+
+
+# Standardkonfiguration
+_DEFAULTS = {
+    # Datenbankeinstellungen
+    'Database': {
+        'type': 'mysql',
+        'host': 'localhost',
+        'port': '3306',
+        'username': 'benutzer',
+        'password': 'passwort',
+        'database': 'inventar',
+        'connection_timeout': '30',
+        'max_connections': '5'
+    },
+    
+    # Scheduler-Einstellungen
+    'Scheduler': {
+        'query_time': '23:00',
+        'retry_attempts': '3',
+        'retry_interval': '10',
+        'retry_interval_max': '120',
+        'max_data_age': '90'
+    },
+    
+    # Berichtseinstellungen
+    'Report': {
+        'highlight_threshold': '10',
+        'history_days': '30',
+        'default_export_format': 'excel',
+        'export_path': './reports'
+    },
+    
+    # Logging-Einstellungen
+    'Logging': {
+        'level': 'INFO',
+        'log_path': './logs',
+        'max_log_size': '10485760',
+        'backup_count': '5'
+    },
+    
+    # UI-Einstellungen
+    'UI': {
+        'theme': 'system',
+        'language': 'de',
+        'refresh_interval': '300'
+    }
+}
+
+
+# Für validate_config notwendige Sektionen und Schlüssel
+_REQUIRED_SECTIONS = frozenset({'Database', 'Scheduler', 'Logging'})
+_REQUIRED_DB_KEYS = frozenset({'type', 'host', 'port', 'username', 'database'})
+_REQUIRED_KEYS = {
+    'Database': _REQUIRED_DB_KEYS,
+    'Scheduler': frozenset({'query_time'}),
+    'Logging': frozenset({'level', 'log_path'})
+}
+
+
+@lru_cache(maxsize=128)
+def _to_int(value):
+    """Wandelt einen Konfigurationswert in eine Ganzzahl um (mit Zwischenspeicher).
+    
+    Args:
+        value (str): Konfigurationswert
+        
+    Returns:
+        int: Ganzzahliger Wert
+        
+    Raises:
+        ValueError: Wenn der Wert keine Zahl ist
+    """
+    return int(value)
+
+
+def _atomic_write(path, data):
+    """Schreibt eine Textdatei atomar über eine temporäre Datei.
+    
+    Bricht der Prozess während des Schreibens ab, bleibt die bisherige Datei erhalten.
+    
+    Args:
+        path (str): Zieldatei
+        data (str): Zu schreibender Inhalt
+    """
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as temp_file:
+        temp_file.write(data)
+        temp_file.flush()
+        os.fsync(temp_file.fileno())
+    os.replace(temp_path, path)
 
 
 class ConfigManager:
@@ -21,6 +115,19 @@ class ConfigManager:
         """
         self.config_path = config_path
         self.config = configparser.ConfigParser()
+        
+        # Bereits geparste Konfiguration, gültig solange Änderungszeit und Größe
+        # der INI-Datei exakt den gespeicherten Werten entsprechen
+        self._cache_path = config_path + '.cache.json'
+        
+        # Ungespeicherte Änderungen seit dem letzten Laden/Speichern
+        self._dirty = False
+        
+        # Flache Sicht (Sektion, Schlüssel) -> Wert für schnelle Einzelabfragen
+        self._flat = {}
+        
+        # Zwischenspeicher für get_section, wird bei jeder Änderung verworfen
+        self._section_cache = {}
     
     def load_config(self):
         """Lädt die Konfiguration aus der Datei.
@@ -30,7 +137,15 @@ class ConfigManager:
         """
         try:
             if os.path.exists(self.config_path):
-                self.config.read(self.config_path, encoding='utf-8')
+                # Stand der INI-Datei vor dem Lesen festhalten
+                source_stat = os.stat(self.config_path)
+                source = [source_stat.st_mtime_ns, source_stat.st_size]
+                
+                if not self._load_cache(source):
+                    self.config.read(self.config_path, encoding='utf-8')
+                    self._write_cache(source)
+                self._rebuild_flat()
+                self._dirty = False
                 return True
             else:
                 return False
@@ -38,6 +153,61 @@ class ConfigManager:
             print(f"Fehler beim Laden der Konfiguration: {str(e)}")
             return False
     
+    def _load_cache(self, source):
+        """Übernimmt die zwischengespeicherte Konfiguration, falls sie aktuell ist.
+        
+        Args:
+            source (list): Änderungszeit (ns) und Größe der INI-Datei
+            
+        Returns:
+            bool: True, wenn der Zwischenspeicher verwendet wurde, sonst False
+        """
+        try:
+            with open(self._cache_path, 'r', encoding='utf-8') as cache_file:
+                payload = json.load(cache_file)
+            
+            # Nur bei exakt gleichem Stand verwenden; auch ältere oder im selben
+            # Zeitstempel geänderte INI-Dateien führen so zum erneuten Parsen
+            if payload.get('source') != source:
+                return False
+            
+            self.config.read_dict(payload['sections'])
+            return True
+        except (OSError, ValueError, TypeError, KeyError, AttributeError, configparser.Error):
+            # Fehlender oder beschädigter Zwischenspeicher: INI-Datei parsen
+            return False
+    
+    def _write_cache(self, source):
+        """Schreibt die geparste Konfiguration atomar in den Zwischenspeicher.
+        
+        Args:
+            source (list): Änderungszeit (ns) und Größe der gelesenen INI-Datei
+        """
+        payload = {
+            'source': source,
+            'sections': {
+                section: dict(self.config.items(section, raw=True))
+                for section in self.config.sections()
+            }
+        }
+        temp_path = self._cache_path + '.tmp'
+        
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump(payload, cache_file, ensure_ascii=False)
+            os.replace(temp_path, self._cache_path)
+        except OSError as e:
+            print(f"Konfigurations-Zwischenspeicher konnte nicht geschrieben werden: {str(e)}")
+    
+    def _rebuild_flat(self):
+        """Baut die flache Sicht neu auf und verwirft alle Zwischenspeicher."""
+        self._flat = {
+            (section, key): value
+            for section in self.config.sections()
+            for key, value in self.config.items(section)
+        }
+        self._section_cache.clear()
+    
     def save_config(self):
         """Speichert die Konfiguration in die Datei.
         
@@ -45,9 +215,16 @@ class ConfigManager:
             bool: True, wenn die Konfiguration erfolgreich gespeichert wurde, sonst False
         """
         try:
+            # Nichts zu tun, wenn die Datei bereits dem aktuellen Stand entspricht
+            if not self._dirty and os.path.exists(self.config_path):
+                return True
+            
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            with open(self.config_path, 'w', encoding='utf-8') as config_file:
-                self.config.write(config_file)
+            buffer = io.StringIO()
+            self.config.write(buffer)
+            _atomic_write(self.config_path, buffer.getvalue())
+            
+            self._dirty = False
             return True
         except Exception as e:
             print(f"Fehler beim Speichern der Konfiguration: {str(e)}")
@@ -64,15 +241,58 @@ class ConfigManager:
         Returns:
             str: Konfigurationswert oder Standardwert
         """
+        return self._flat.get((section, self.config.optionxform(key)), default)
+    
+    def get_int(self, section, key, default=0):
+        """Holt einen Konfigurationswert als Ganzzahl.
+        
+        Args:
+            section (str): Konfigurationssektion
+            key (str): Konfigurationsschlüssel
+            default (int, optional): Standardwert, falls der Schlüssel fehlt oder keine Zahl ist
+            
+        Returns:
+            int: Konfigurationswert oder Standardwert
+        """
+        value = self._flat.get((section, self.config.optionxform(key)))
+        if value is None:
+            return default
+        
         try:
-            if section in self.config and key in self.config[section]:
-                return self.config[section][key]
-            else:
-                return default
-        except Exception as e:
-            print(f"Fehler beim Abrufen des Konfigurationswerts: {str(e)}")
+            return _to_int(value)
+        except ValueError:
+            print(f"Ungültiger Zahlenwert für {section}.{key}: {value}")
             return default
     
+    def get_section(self, section, defaults=None):
+        """Holt alle Werte einer Konfigurationssektion auf einmal.
+        
+        Ohne Standardwerte wird das zwischengespeicherte Ergebnis zurückgegeben, das
+        bis zur nächsten Änderung der Sektion gültig bleibt und vom Aufrufer nicht
+        verändert werden darf. Mit Standardwerten wird ein neues Dict geliefert.
+        
+        Args:
+            section (str): Konfigurationssektion
+            defaults (dict, optional): Standardwerte für fehlende Schlüssel
+            
+        Returns:
+            dict: Schlüssel und Werte der Sektion (leer, falls die Sektion nicht existiert)
+        """
+        try:
+            values = self._section_cache.get(section)
+            if values is None:
+                values = dict(self.config[section]) if section in self.config else {}
+                self._section_cache[section] = values
+            
+            if defaults:
+                merged = dict(defaults)
+                merged.update(values)
+                return merged
+            return values
+        except Exception as e:
+            print(f"Fehler beim Abrufen der Konfigurationssektion: {str(e)}")
+            return dict(defaults) if defaults else {}
+    
     def set_value(self, section, key, value):
         """Setzt einen Konfigurationswert.
         
@@ -89,11 +309,41 @@ class ConfigManager:
                 self.config[section] = {}
             
             self.config[section][key] = str(value)
+            self._flat[(section, self.config.optionxform(key))] = self.config[section][key]
+            self._section_cache.pop(section, None)
+            self._dirty = True
             return True
         except Exception as e:
             print(f"Fehler beim Setzen des Konfigurationswerts: {str(e)}")
             return False
     
+    def update_many(self, changes):
+        """Setzt mehrere Konfigurationswerte in einem Durchlauf.
+        
+        Args:
+            changes (dict): Zuordnung Sektion -> {Schlüssel: Wert}
+            
+        Returns:
+            bool: True, wenn alle Werte erfolgreich gesetzt wurden, sonst False
+        """
+        try:
+            for section, values in changes.items():
+                if section not in self.config:
+                    self.config[section] = {}
+                
+                section_proxy = self.config[section]
+                for key, value in values.items():
+                    section_proxy[key] = str(value)
+                    self._flat[(section, self.config.optionxform(key))] = section_proxy[key]
+                
+                self._section_cache.pop(section, None)
+            
+            self._dirty = True
+            return True
+        except Exception as e:
+            print(f"Fehler beim Setzen der Konfigurationswerte: {str(e)}")
+            return False
+    
     def create_default_config(self):
         """Erstellt eine Standardkonfiguration.
         
@@ -101,49 +351,13 @@ class ConfigManager:
             bool: True, wenn die Standardkonfiguration erfolgreich erstellt wurde, sonst False
         """
         try:
-            # Datenbankeinstellungen
-            self.config['Database'] = {
-                'type': 'mysql',
-                'host': 'localhost',
-                'port': '3306',
-                'username': 'benutzer',
-                'password': 'passwort',
-                'database': 'inventar',
-                'connection_timeout': '30',
-                'max_connections': '5'
-            }
-            
-            # Scheduler-Einstellungen
-            self.config['Scheduler'] = {
-                'query_time': '23:00',
-                'retry_attempts': '3',
-                'retry_interval': '10',
-                'max_data_age': '90'
-            }
-            
-            # Berichtseinstellungen
-            self.config['Report'] = {
-                'highlight_threshold': '10',
-                'history_days': '30',
-                'default_export_format': 'excel',
-                'export_path': './reports'
-            }
-            
-            # Logging-Einstellungen
-            self.config['Logging'] = {
-                'level': 'INFO',
-                'log_path': './logs',
-                'max_log_size': '10485760',
-                'backup_count': '5'
-            }
-            
-            # UI-Einstellungen
-            self.config['UI'] = {
-                'theme': 'system',
-                'language': 'de',
-                'refresh_interval': '300'
-            }
+            # Vorhandene Standardsektionen vollständig ersetzen, wie bei einer Neuanlage
+            for section in _DEFAULTS:
+                self.config.remove_section(section)
+            self.config.read_dict(_DEFAULTS)
             
+            self._rebuild_flat()
+            self._dirty = True
             return self.save_config()
         except Exception as e:
             print(f"Fehler beim Erstellen der Standardkonfiguration: {str(e)}")
@@ -157,30 +371,19 @@ class ConfigManager:
         """
         try:
             # Prüfen auf notwendige Sektionen
-            required_sections = ['Database', 'Scheduler', 'Logging']
-            for section in required_sections:
-                if section not in self.config:
-                    print(f"Fehlende Konfigurationssektion: {section}")
-                    return False
-            
-            # Datenbankeinstellungen prüfen
-            db_section = self.config['Database']
-            required_db_keys = ['type', 'host', 'port', 'username', 'database']
-            for key in required_db_keys:
-                if key not in db_section:
-                    print(f"Fehlender Datenbank-Konfigurationsschlüssel: {key}")
-                    return False
-            
-            # Scheduler-Einstellungen prüfen
-            scheduler_section = self.config['Scheduler']
-            if 'query_time' not in scheduler_section:
-                print("Fehlender Scheduler-Konfigurationsschlüssel: query_time")
+            missing_sections = _REQUIRED_SECTIONS.difference(self.config.sections())
+            if missing_sections:
+                print(f"Fehlende Konfigurationssektionen: {', '.join(sorted(missing_sections))}")
                 return False
             
-            # Logging-Einstellungen prüfen
-            logging_section = self.config['Logging']
-            if 'level' not in logging_section or 'log_path' not in logging_section:
-                print("Fehlende Logging-Konfigurationsschlüssel")
+            # Notwendige Schlüssel aller Sektionen auf einmal prüfen
+            missing_keys = [
+                f"{section}.{key}"
+                for section, required_keys in _REQUIRED_KEYS.items()
+                for key in sorted(required_keys.difference(self.config[section]))
+            ]
+            if missing_keys:
+                print(f"Fehlende Konfigurationsschlüssel: {', '.join(missing_keys)}")
                 return False
             
             return True
@@ -7,15 +7,19 @@ Stellt Logging-Funktionalität für alle Anwendungskomponenten bereit.
 """
 
 import os
+import queue
 import logging
-from logging.handlers import RotatingFileHandler
-from datetime import datetime
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+from datetime import date
 import traceback
 
 
 class Logger:
     """Klasse zur Verwaltung der Logging-Funktionalität."""
     
+    # Gemeinsame Instanz, siehe get()
+    _instance = None
+    
     def __init__(self, log_level="INFO", log_path="./logs", max_log_size=10485760, backup_count=5):
         """Initialisiert den Logger.
         
@@ -29,28 +33,77 @@ class Logger:
         self.log_path = log_path
         self.max_log_size = max_log_size
         self.backup_count = backup_count
+        self._level_int = getattr(logging, self.log_level, logging.INFO)
         self.logger = None
+        self._listener = None
+        self._handlers_attached = False
+        self._log_path_cache = (None, None)
+    
+    @classmethod
+    def get(cls, *args, **kwargs):
+        """Gibt die gemeinsame Logger-Instanz zurück.
+        
+        Beim ersten Aufruf wird die Instanz mit den übergebenen Argumenten erstellt
+        und eingerichtet; spätere Aufrufe liefern dieselbe Instanz, ohne Handler
+        oder Logdatei erneut anzulegen.
+        
+        Args:
+            *args: Argumente für den Konstruktor (nur beim ersten Aufruf verwendet)
+            **kwargs: Schlüsselwortargumente für den Konstruktor
+            
+        Returns:
+            Logger: Gemeinsame Logger-Instanz
+        """
+        if cls._instance is None:
+            cls._instance = cls(*args, **kwargs)
+            cls._instance.setup_logging()
+        return cls._instance
     
     def setup_logging(self):
         """Richtet das Logging-System ein.
         
+        Datei- und Konsolen-Handler werden erst beim ersten Log-Aufruf angelegt
+        (siehe _ensure_handlers), damit Aufrufe ohne Log-Ausgabe keine Logdatei öffnen.
+        
         Returns:
             logging.Logger: Konfigurierter Logger
         """
+        # Logger erstellen
+        self.logger = logging.getLogger('artikel_tracker')
+        self.logger.setLevel(self._level_int)
+        
+        # Bestehende Handler entfernen, um Doppel-Logging zu verhindern
+        self.shutdown()
+        if self.logger.handlers:
+            self.logger.handlers.clear()
+        
+        # Direkt gebundene Log-Methoden einer früheren Einrichtung verwerfen
+        for name in ('log_info', 'log_warning', 'log_error', 'log_debug'):
+            self.__dict__.pop(name, None)
+        
+        self._handlers_attached = False
+        self.isEnabledFor = self.logger.isEnabledFor
+        return self.logger
+    
+    def _ensure_handlers(self):
+        """Legt die Handler beim ersten Log-Aufruf an.
+        
+        Returns:
+            bool: True, wenn ein Logger zur Verfügung steht, sonst False
+        """
+        if not self.logger:
+            return False
+        if self._handlers_attached:
+            return True
+        
+        self._handlers_attached = True
+        
         try:
             # Stellen Sie sicher, dass das Log-Verzeichnis existiert
             os.makedirs(self.log_path, exist_ok=True)
             
-            # Logger erstellen
-            self.logger = logging.getLogger('artikel_tracker')
-            self.logger.setLevel(getattr(logging, self.log_level))
-            
-            # Bestehende Handler entfernen, um Doppel-Logging zu verhindern
-            if self.logger.handlers:
-                self.logger.handlers.clear()
-            
             # Log-Dateiname basierend auf aktuellem Datum
-            log_filename = os.path.join(self.log_path, f"artikel_tracker_{datetime.now().strftime('%Y-%m-%d')}.log")
+            log_filename = self.get_log_file_path()
             
             # Datei-Handler mit Rotation
             file_handler = RotatingFileHandler(
@@ -68,12 +121,17 @@ class Logger:
             file_handler.setFormatter(formatter)
             console_handler.setFormatter(formatter)
             
-            # Handler hinzufügen
-            self.logger.addHandler(file_handler)
-            self.logger.addHandler(console_handler)
+            # Datei- und Konsolenausgabe in einem Hintergrund-Thread, damit
+            # Scheduler- und GUI-Threads nicht auf Schreibzugriffe warten
+            log_queue = queue.Queue(-1)
+            self._listener = QueueListener(log_queue, file_handler, console_handler,
+                                           respect_handler_level=True)
+            self._listener.start()
+            
+            self.logger.addHandler(QueueHandler(log_queue))
             
+            self._bind_log_methods()
             self.log_info("Logging erfolgreich eingerichtet")
-            return self.logger
         
         except Exception as e:
             print(f"Fehler beim Einrichten des Loggers: {str(e)}")
@@ -83,56 +141,83 @@ class Logger:
             default_handler = logging.StreamHandler()
             default_logger.addHandler(default_handler)
             self.logger = default_logger
-            return default_logger
+            self._bind_log_methods()
+        
+        return True
+    
+    def _bind_log_methods(self):
+        """Bindet die Log-Methoden direkt an den eingerichteten Logger.
+        
+        Danach entfallen die Prüfung auf einen vorhandenen Logger und der
+        zusätzliche Methodenaufruf; die Level-Prüfung übernimmt logging selbst.
+        """
+        self.log_info = self.logger.info
+        self.log_warning = self.logger.warning
+        self.log_error = self.logger.error
+        self.log_debug = self.logger.debug
+        self.isEnabledFor = self.logger.isEnabledFor
     
-    def log_info(self, message):
+    def log_info(self, message, *args):
         """Protokolliert eine Information.
         
         Args:
-            message (str): Zu protokollierende Nachricht
+            message (str): Zu protokollierende Nachricht, ggf. mit %-Platzhaltern
+            *args: Werte für die Platzhalter, erst bei Ausgabe eingesetzt
         """
-        if self.logger:
-            self.logger.info(message)
+        if self._ensure_handlers():
+            self.logger.info(message, *args)
         else:
-            print(f"INFO: {message}")
+            print(f"INFO: {message % args if args else message}")
     
-    def log_warning(self, message):
+    def log_warning(self, message, *args):
         """Protokolliert eine Warnung.
         
         Args:
-            message (str): Zu protokollierende Warnung
+            message (str): Zu protokollierende Warnung, ggf. mit %-Platzhaltern
+            *args: Werte für die Platzhalter, erst bei Ausgabe eingesetzt
         """
-        if self.logger:
-            self.logger.warning(message)
+        if self._ensure_handlers():
+            self.logger.warning(message, *args)
         else:
-            print(f"WARNING: {message}")
+            print(f"WARNING: {message % args if args else message}")
     
-    def log_error(self, message, exc_info=False):
+    def log_error(self, message, *args, exc_info=False):
         """Protokolliert einen Fehler.
         
         Args:
-            message (str): Zu protokollierender Fehler
+            message (str): Zu protokollierender Fehler, ggf. mit %-Platzhaltern
+            *args: Werte für die Platzhalter, erst bei Ausgabe eingesetzt
             exc_info (bool): Ob Exception-Information hinzugefügt werden soll
         """
-        if self.logger:
-            self.logger.error(message, exc_info=exc_info)
-            if exc_info:
-                self.logger.error(traceback.format_exc())
+        if self._ensure_handlers():
+            self.logger.error(message, *args, exc_info=exc_info)
         else:
-            print(f"ERROR: {message}")
+            print(f"ERROR: {message % args if args else message}")
             if exc_info:
                 print(traceback.format_exc())
     
-    def log_debug(self, message):
+    def log_debug(self, message, *args):
         """Protokolliert eine Debug-Information.
         
         Args:
-            message (str): Zu protokollierende Debug-Information
+            message (str): Zu protokollierende Debug-Information, ggf. mit %-Platzhaltern
+            *args: Werte für die Platzhalter, erst bei Ausgabe eingesetzt
         """
-        if self.logger:
-            self.logger.debug(message)
+        if self._ensure_handlers():
+            self.logger.debug(message, *args)
         else:
-            print(f"DEBUG: {message}")
+            print(f"DEBUG: {message % args if args else message}")
+    
+    def isEnabledFor(self, level):
+        """Prüft, ob Meldungen eines Levels ausgegeben würden.
+        
+        Args:
+            level (int): Logging-Level, z.B. logging.DEBUG
+            
+        Returns:
+            bool: True, wenn das Level aktiv ist
+        """
+        return level >= self._level_int
     
     def get_log_file_path(self):
         """Gibt den Pfad zur aktuellen Logdatei zurück.
@@ -140,12 +225,46 @@ class Logger:
         Returns:
             str: Pfad zur aktuellen Logdatei
         """
-        log_filename = os.path.join(self.log_path, f"artikel_tracker_{datetime.now().strftime('%Y-%m-%d')}.log")
+        # Pfad nur beim Datumswechsel neu zusammensetzen
+        today = date.today()
+        if self._log_path_cache[0] == today:
+            return self._log_path_cache[1]
+        
+        log_filename = os.path.join(self.log_path, f"artikel_tracker_{today.isoformat()}.log")
+        self._log_path_cache = (today, log_filename)
         return log_filename
     
     def rotate_logs(self):
         """Erzwingt eine Rotation der Logdateien."""
-        for handler in self.logger.handlers:
+        handlers = self._listener.handlers if self._listener else self.logger.handlers
+        for handler in handlers:
             if isinstance(handler, RotatingFileHandler):
-                handler.doRollover()
+                # Sperre verhindert, dass der Listener-Thread währenddessen schreibt
+                handler.acquire()
+                try:
+                    handler.doRollover()
+                finally:
+                    handler.release()
                 self.log_info("Logdatei-Rotation durchgeführt")
+    
+    def shutdown(self):
+        """Schreibt ausstehende Log-Einträge und beendet den Hintergrund-Thread.
+        
+        Der QueueHandler wird dabei vom Logger entfernt; ein späterer Log-Aufruf
+        legt die Handler über _ensure_handlers neu an.
+        """
+        if self._listener:
+            # Erst abhängen, damit keine Einträge mehr in der unbeobachteten Queue landen
+            for handler in list(self.logger.handlers):
+                if isinstance(handler, QueueHandler):
+                    self.logger.removeHandler(handler)
+            
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+            
+            # Direkt gebundene Log-Methoden verwerfen, damit wieder _ensure_handlers greift
+            for name in ('log_info', 'log_warning', 'log_error', 'log_debug'):
+                self.__dict__.pop(name, None)
+            self._handlers_attached = False
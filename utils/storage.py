@@ -7,24 +7,141 @@ Verantwortlich für die lokale Speicherung und Verwaltung von Anwendungsdaten.
 """
 
 import os
+import re
+import sys
+import mmap
 import json
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+# orjson ist optional und beschleunigt das Schreiben und Lesen der JSON-Dateien
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# zstandard ist optional und wird für komprimierte Datendateien benötigt
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+
+# Dateinamen im Format <identifier>_<YYYYMMDD>_<HHMMSS>.json, komprimiert mit Endung .json.zst
+_FN_RE = re.compile(r'^(.+?)_(\d{8})_\d{6}\.json(?:\.zst)?$')
+_DATA_SUFFIXES = ('.json', '.json.zst')
+
+# Temporäre Dateien von save_data(), bleiben nach einem Abbruch zurück
+_TEMP_SUFFIX = '.json.tmp'
+_CLEAN_SUFFIXES = _DATA_SUFFIXES + (_TEMP_SUFFIX,)
+
+# Kompressionsstufe für zstd
+_ZSTD_LEVEL = 3
+
+# Felder mit wenigen verschiedenen Werten, deren String-Werte beim Laden interniert werden;
+# eindeutige Werte wie Zeitstempel oder Bezeichner würden die Intern-Tabelle nur wachsen lassen
+_INTERN_VALUE_KEYS = frozenset({'category', 'status'})
+
+# Ab dieser Größe werden Dateien per mmap gelesen
+_MMAP_MIN_SIZE = 64 * 1024
+
+# Dateirechte temporärer Datendateien; das Betriebssystem zieht die umask ab wie bei open()
+_FILE_MODE = 0o666
+
+# Flags zum exklusiven Anlegen temporärer Dateien (O_BINARY gibt es nur unter Windows)
+_TEMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+# Ab so vielen ungesicherten Dateien ruft save_data() automatisch flush() auf
+_MAX_PENDING_FSYNC = 100
+
+
+if orjson is not None:
+    def _dumps(obj):
+        """Serialisiert ein Objekt als eingerücktes UTF-8-JSON (bytes)."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    # orjson verwendet für Schlüssel bereits einen eigenen Cache
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        """Serialisiert ein Objekt als eingerücktes UTF-8-JSON (bytes)."""
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+    def _intern_pairs(pairs):
+        """Baut ein dict mit internierten Schlüsseln und Werten ausgewählter Felder.
+
+        Gleiche Schlüssel und Werte aus vielen geladenen Dateien teilen sich so
+        ein einziges String-Objekt.
+        """
+        return {
+            sys.intern(key): (
+                sys.intern(value) if key in _INTERN_VALUE_KEYS and isinstance(value, str) else value
+            )
+            for key, value in pairs
+        }
+
+    def _loads(data):
+        """Deserialisiert UTF-8-JSON (bytes) mit internierten Strings."""
+        return json.loads(data, object_pairs_hook=_intern_pairs)
+
+
+def _walk_prefix(obj, parts):
+    """Liefert die Elemente eines geladenen Objekts unter einem ijson-Präfix.
+    
+    Args:
+        obj: Geladenes JSON-Objekt
+        parts (list): Präfix-Bestandteile; 'item' steht für die Elemente einer Liste
+        
+    Yields:
+        Elemente unter dem Präfix
+    """
+    if not parts:
+        yield obj
+        return
+    
+    head, rest = parts[0], parts[1:]
+    if head == 'item':
+        if isinstance(obj, list):
+            for item in obj:
+                yield from _walk_prefix(item, rest)
+    elif isinstance(obj, dict) and head in obj:
+        yield from _walk_prefix(obj[head], rest)
+
 
 class Storage:
     """Klasse zur lokalen Speicherung und Verwaltung von Anwendungsdaten."""
     
-    def __init__(self, base_path="./data/storage", logger=None):
+    # ijson-Backend, wird beim ersten Aufruf von iter_data() geladen (False: nicht installiert)
+    _ijson = None
+    
+    def __init__(self, base_path="./data/storage", logger=None, compress=False, dict_path=None):
         """Initialisiert den Storage.
         
         Args:
             base_path (str): Basispfad für die Datenspeicherung
             logger (Logger, optional): Logger-Instanz
+            compress (bool): Neue Dateien mit zstd komprimiert speichern (benötigt zstandard)
+            dict_path (str, optional): Pfad zu einem trainierten zstd-Wörterbuch
         """
         self.base_path = base_path
         self.logger = logger
         
+        # zstd-Kontexte; lesen können komprimierte Dateien immer, wenn zstandard installiert ist
+        self._compressor = None
+        self._decompressor = None
+        if zstd is not None:
+            zstd_dict = None
+            if dict_path:
+                with open(dict_path, 'rb') as f:
+                    zstd_dict = zstd.ZstdCompressionDict(f.read())
+            
+            self._decompressor = zstd.ZstdDecompressor(dict_data=zstd_dict)
+            if compress:
+                self._compressor = zstd.ZstdCompressor(level=_ZSTD_LEVEL, dict_data=zstd_dict)
+        elif compress:
+            self._log('warning', "zstandard ist nicht installiert, Daten werden unkomprimiert gespeichert")
+        
         # Standardverzeichnisse
         self.dirs = {
             'articles': os.path.join(base_path, 'articles'),
@@ -32,11 +149,24 @@ class Storage:
             'temp': os.path.join(base_path, 'temp')
         }
         
+        # Inhalte der Tagesverzeichnisse:
+        # Pfad -> (st_mtime_ns, [Dateipfade], {Bezeichner: [Dateipfade]})
+        self._dir_cache = {}
+        
+        # Gespeicherte, aber noch nicht mit fsync gesicherte Dateien
+        self._pending_fsync = []
+        
         # Verzeichnisse erstellen
         for dir_path in self.dirs.values():
             os.makedirs(dir_path, exist_ok=True)
         
-        self._log("Storage initialisiert")
+        # Bereits angelegte Verzeichnisse, für die save_data() kein makedirs mehr braucht
+        self._known_dirs = set(self.dirs.values())
+        
+        # Dateien aus dem früheren flachen Layout in Tagesverzeichnisse verschieben
+        self._migrate_flat_files()
+        
+        self._log('info', "Storage initialisiert")
     
     def save_data(self, data, category, identifier, timestamp=None):
         """Speichert Daten.
@@ -52,18 +182,25 @@ class Storage:
         """
         try:
             # Kategorieverzeichnis überprüfen/erstellen
-            if category not in self.dirs:
-                self.dirs[category] = os.path.join(self.base_path, category)
-                os.makedirs(self.dirs[category], exist_ok=True)
+            cat_dir = self.dirs.get(category)
+            if cat_dir is None:
+                cat_dir = self.dirs[category] = os.path.join(self.base_path, category)
+                os.makedirs(cat_dir, exist_ok=True)
+                self._known_dirs.add(cat_dir)
             
             # Zeitstempel setzen, falls nicht angegeben
             if timestamp is None:
                 timestamp = datetime.now()
             
-            # Dateinamen generieren
+            # Dateinamen generieren, Ablage in <Kategorie>/YYYY/MM/DD
             timestamp_str = timestamp.strftime('%Y%m%d_%H%M%S')
-            filename = f"{identifier}_{timestamp_str}.json"
-            file_path = os.path.join(self.dirs[category], filename)
+            extension = '.json.zst' if self._compressor else '.json'
+            filename = f"{identifier}_{timestamp_str}{extension}"
+            day_dir = self._day_dir(cat_dir, timestamp_str[:8])
+            if day_dir not in self._known_dirs:
+                os.makedirs(day_dir, exist_ok=True)
+                self._known_dirs.add(day_dir)
+            file_path = os.path.join(day_dir, filename)
             
             # Daten mit Metadaten anreichern
             data_with_meta = {
@@ -73,17 +210,79 @@ class Storage:
                 'data': data
             }
             
-            # Daten speichern
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data_with_meta, f, ensure_ascii=False, indent=2)
+            # Daten über eine temporäre Datei atomar speichern, damit bei einem Abbruch
+            # keine halb geschriebene Datei entsteht; fsync erfolgt gesammelt in flush()
+            payload = _dumps(data_with_meta)
+            if self._compressor:
+                payload = self._compressor.compress(payload)
             
-            self._log(f"Daten gespeichert: {file_path}")
+            # Zufälliger Name plus O_EXCL statt mkstemp, das immer 0o600 vergibt;
+            # os.replace übernimmt die Rechte der temporären Datei
+            temp_path = os.path.join(day_dir, os.urandom(8).hex() + _TEMP_SUFFIX)
+            fd = os.open(temp_path, _TEMP_FLAGS, _FILE_MODE)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(payload)
+                os.replace(temp_path, file_path)
+            except Exception:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+                raise
+            
+            self._pending_fsync.append(file_path)
+            if len(self._pending_fsync) >= _MAX_PENDING_FSYNC:
+                self.flush()
+            self._dir_cache.pop(day_dir, None)
+            
+            self._log('info', "Daten gespeichert: %s", file_path)
             return file_path
             
         except Exception as e:
-            self._log(f"Fehler beim Speichern der Daten: {str(e)}", level='error')
+            self._log('error', "Fehler beim Speichern der Daten: %s", e)
             return None
     
+    def flush(self):
+        """Sichert alle seit dem letzten Aufruf gespeicherten Dateien mit fsync.
+        
+        Unter POSIX werden zusätzlich die betroffenen Verzeichnisse gesichert,
+        damit auch das Umbenennen durch os.replace dauerhaft ist. save_data()
+        ruft die Methode automatisch auf, sobald zu viele Dateien ausstehen.
+        
+        Returns:
+            int: Anzahl der gesicherten Dateien
+        """
+        pending, self._pending_fsync = self._pending_fsync, []
+        synced = 0
+        
+        for file_path in pending:
+            try:
+                # Unter Windows schlägt fsync auf einem nur lesend geöffneten Handle fehl
+                fd = os.open(file_path, os.O_RDWR)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                synced += 1
+            except OSError as e:
+                # Die Datei kann inzwischen gelöscht worden sein
+                self._log('warning', "Fehler beim Sichern von %s: %s", file_path, e)
+        
+        # Verzeichnisse lassen sich unter Windows nicht öffnen und sichern
+        if os.name == 'posix':
+            for dir_path in {os.path.dirname(file_path) for file_path in pending}:
+                try:
+                    fd = os.open(dir_path, os.O_RDONLY)
+                    try:
+                        os.fsync(fd)
+                    finally:
+                        os.close(fd)
+                except OSError as e:
+                    self._log('warning', "Fehler beim Sichern von %s: %s", dir_path, e)
+        
+        return synced
+    
     def load_data(self, file_path):
         """Lädt Daten aus einer Datei.
         
@@ -95,19 +294,79 @@ class Storage:
         """
         try:
             if not os.path.exists(file_path):
-                self._log(f"Datei nicht gefunden: {file_path}", level='warning')
+                self._log('warning', "Datei nicht gefunden: %s", file_path)
+                return None
+            
+            compressed = file_path.endswith('.zst')
+            if compressed and self._decompressor is None:
+                self._log('error', "zstandard ist nicht installiert, Datei kann nicht gelesen werden: %s", file_path)
                 return None
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                # Komprimierte Dateien entpacken; große unkomprimierte Dateien direkt aus
+                # dem Page-Cache parsen (nur orjson kann aus einem memoryview lesen)
+                if compressed:
+                    data = _loads(self._decompressor.decompress(f.read()))
+                elif orjson is not None and os.fstat(f.fileno()).st_size > _MMAP_MIN_SIZE:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                        data = _loads(view)
+                else:
+                    data = _loads(f.read())
             
-            self._log(f"Daten geladen: {file_path}")
+            self._log('info', "Daten geladen: %s", file_path)
             return data
             
         except Exception as e:
-            self._log(f"Fehler beim Laden der Daten: {str(e)}", level='error')
+            self._log('error', "Fehler beim Laden der Daten: %s", e)
             return None
     
+    def iter_data(self, file_path, prefix='data.item'):
+        """Liest die Einträge einer Datendatei einzeln.
+        
+        Mit ijson wird die Datei gestreamt, sodass auch große Berichte nicht
+        vollständig in den Speicher geladen werden. Ohne ijson wird die Datei
+        mit load_data() geladen.
+        
+        Args:
+            file_path (str): Pfad zur Datendatei
+            prefix (str): ijson-Präfix der Einträge (Standard: Elemente der Liste unter 'data')
+            
+        Yields:
+            Einzelne Einträge unter dem Präfix
+        """
+        if Storage._ijson is None:
+            try:
+                import ijson
+                try:
+                    Storage._ijson = ijson.get_backend('yajl2_c')
+                except ImportError:
+                    Storage._ijson = ijson
+            except ImportError:
+                Storage._ijson = False
+        
+        if not Storage._ijson:
+            data = self.load_data(file_path)
+            if data is not None:
+                yield from _walk_prefix(data, prefix.split('.') if prefix else [])
+            return
+        
+        try:
+            if not os.path.exists(file_path):
+                self._log('warning', "Datei nicht gefunden: %s", file_path)
+                return
+            
+            compressed = file_path.endswith('.zst')
+            if compressed and self._decompressor is None:
+                self._log('error', "zstandard ist nicht installiert, Datei kann nicht gelesen werden: %s", file_path)
+                return
+            
+            with open(file_path, 'rb') as f:
+                source = self._decompressor.stream_reader(f) if compressed else f
+                yield from Storage._ijson.items(source, prefix, use_float=True)
+            
+        except Exception as e:
+            self._log('error', "Fehler beim Lesen der Daten: %s", e)
+    
     def delete_data(self, file_path):
         """Löscht eine Datendatei.
         
@@ -119,15 +378,16 @@ class Storage:
         """
         try:
             if not os.path.exists(file_path):
-                self._log(f"Datei nicht gefunden: {file_path}", level='warning')
+                self._log('warning', "Datei nicht gefunden: %s", file_path)
                 return False
             
             os.remove(file_path)
-            self._log(f"Datei gelöscht: {file_path}")
+            self._dir_cache.pop(os.path.dirname(file_path), None)
+            self._log('info', "Datei gelöscht: %s", file_path)
             return True
             
         except Exception as e:
-            self._log(f"Fehler beim Löschen der Datei: {str(e)}", level='error')
+            self._log('error', "Fehler beim Löschen der Datei: %s", e)
             return False
     
     def get_data_by_date(self, category, date, exact_match=False):
@@ -143,34 +403,26 @@ class Storage:
         """
         try:
             if category not in self.dirs:
-                self._log(f"Kategorie nicht gefunden: {category}", level='warning')
+                self._log('warning', "Kategorie nicht gefunden: %s", category)
                 return []
             
             date_str = date.strftime('%Y%m%d')
-            result_files = []
             
-            # Alle Dateien in der Kategorie durchsuchen
-            for filename in os.listdir(self.dirs[category]):
-                if not filename.endswith('.json'):
-                    continue
-                
-                # Datum aus Dateinamen extrahieren
-                try:
-                    file_date_str = filename.split('_')[1][:8]  # YYYYMMDD
-                    
-                    if exact_match and file_date_str == date_str:
-                        result_files.append(os.path.join(self.dirs[category], filename))
-                    elif not exact_match and file_date_str <= date_str:
-                        result_files.append(os.path.join(self.dirs[category], filename))
-                except:
-                    # Bei Fehlern in der Datumsverarbeitung überspringen
-                    continue
+            # Nur die betroffenen Tagesverzeichnisse lesen
+            list_day = self._list_day
+            if exact_match:
+                result_files = list(list_day(self._day_dir(self.dirs[category], date_str))[0])
+            else:
+                result_files = []
+                extend = result_files.extend
+                for _, day_dir in self._day_dirs(category, last=date_str):
+                    extend(list_day(day_dir)[0])
             
-            self._log(f"{len(result_files)} Datendateien für Datum {date_str} gefunden")
-            return sorted(result_files)  # Nach Dateinamen (also Datum) sortieren
+            self._log('info', "%d Datendateien für Datum %s gefunden", len(result_files), date_str)
+            return result_files  # Nach Datum und Dateinamen sortiert
             
         except Exception as e:
-            self._log(f"Fehler beim Abrufen von Daten nach Datum: {str(e)}", level='error')
+            self._log('error', "Fehler beim Abrufen von Daten nach Datum: %s", e)
             return []
     
     def get_data_by_article(self, article_id, category='articles', max_age=None):
@@ -186,43 +438,25 @@ class Storage:
         """
         try:
             if category not in self.dirs:
-                self._log(f"Kategorie nicht gefunden: {category}", level='warning')
+                self._log('warning', "Kategorie nicht gefunden: %s", category)
                 return []
             
-            result_files = []
-            
-            # Cutoff-Datum berechnen, falls max_age angegeben
-            cutoff_date = None
+            # Cutoff-Datum berechnen, falls max_age angegeben; ältere Tage werden gar nicht gelesen
+            cutoff_str = None
             if max_age is not None:
-                cutoff_date = datetime.now() - timedelta(days=max_age)
+                cutoff_str = (datetime.now() - timedelta(days=max_age)).strftime('%Y%m%d')
             
-            # Alle Dateien in der Kategorie durchsuchen
-            for filename in os.listdir(self.dirs[category]):
-                if not filename.endswith('.json') or not filename.startswith(f"{article_id}_"):
-                    continue
-                
-                file_path = os.path.join(self.dirs[category], filename)
-                
-                # Prüfe Alter, falls cutoff_date gesetzt
-                if cutoff_date:
-                    try:
-                        # Datum aus Dateinamen extrahieren
-                        date_str = filename.split('_')[1][:8]  # YYYYMMDD
-                        file_date = datetime.strptime(date_str, '%Y%m%d')
-                        
-                        if file_date < cutoff_date:
-                            continue
-                    except:
-                        # Bei Fehlern in der Datumsverarbeitung überspringen
-                        continue
-                
-                result_files.append(file_path)
+            result_files = []
+            extend = result_files.extend
+            list_day = self._list_day
+            for _, day_dir in self._day_dirs(category, first=cutoff_str):
+                extend(list_day(day_dir)[1].get(article_id, ()))
             
-            self._log(f"{len(result_files)} Datendateien für Artikel {article_id} gefunden")
-            return sorted(result_files)  # Nach Dateinamen (also Datum) sortieren
+            self._log('info', "%d Datendateien für Artikel %s gefunden", len(result_files), article_id)
+            return result_files  # Nach Dateinamen (also Datum) sortiert
             
         except Exception as e:
-            self._log(f"Fehler beim Abrufen von Daten nach Artikel: {str(e)}", level='error')
+            self._log('error', "Fehler beim Abrufen von Daten nach Artikel: %s", e)
             return []
     
     def clean_old_data(self, category=None, days=90):
@@ -236,67 +470,292 @@ class Storage:
             int: Anzahl der gelöschten Dateien
         """
         try:
-            self._log(f"Bereinige alte Daten (älter als {days} Tage)")
+            self._log('info', "Bereinige alte Daten (älter als %d Tage)", days)
             
             cutoff_date = datetime.now() - timedelta(days=days)
-            deleted_count = 0
+            cutoff_str = cutoff_date.strftime('%Y%m%d')
+            cutoff_ts = cutoff_date.timestamp()
             
             # Zu durchsuchende Kategorien bestimmen
-            categories = [category] if category else self.dirs.keys()
+            categories = [
+                cat for cat in ([category] if category else self.dirs.keys())
+                if cat in self.dirs and os.path.exists(self.dirs[cat])
+            ]
             
-            for cat in categories:
-                if cat not in self.dirs or not os.path.exists(self.dirs[cat]):
-                    continue
-                
-                for filename in os.listdir(self.dirs[cat]):
-                    if not filename.endswith('.json'):
+            # Die Kategorien liegen in getrennten Verzeichnissen und werden parallel
+            # bereinigt; scandir, stat und unlink geben dabei die GIL frei
+            if len(categories) > 1:
+                with ThreadPoolExecutor(max_workers=min(8, len(categories))) as executor:
+                    results = list(executor.map(
+                        lambda cat: self._clean_category(cat, cutoff_str, cutoff_ts), categories
+                    ))
+            else:
+                results = [self._clean_category(cat, cutoff_str, cutoff_ts) for cat in categories]
+            
+            deleted = [path for paths in results for path in paths]
+            
+            # Listing-Cache erst nach allen Threads verwerfen; leere Tagesverzeichnisse
+            # wurden eventuell entfernt und müssen beim Speichern neu angelegt werden
+            if deleted:
+                self._dir_cache.clear()
+            self._known_dirs.intersection_update(self.dirs.values())
+            
+            deleted_count = len(deleted)
+            
+            self._log('info', "%d alte Datendateien gelöscht", deleted_count)
+            return deleted_count
+        
+        except Exception as e:
+            self._log('error', "Fehler bei der Bereinigung alter Daten: %s", e)
+            return 0
+    
+    def _clean_category(self, category, cutoff_str, cutoff_ts):
+        """Löscht die veralteten Dateien einer Kategorie.
+        
+        Tagesverzeichnisse vor dem Cutoff werden vollständig geleert und entfernt.
+        Dateien direkt im Kategorieverzeichnis werden nach dem Datum im Namen
+        oder, falls keines vorhanden ist, nach dem Dateisystem-Datum bewertet.
+        Zurückgebliebene temporäre Dateien werden mit entfernt, aber nicht gezählt.
+        
+        Args:
+            category (str): Datenkategorie
+            cutoff_str (str): Cutoff-Datum im Format YYYYMMDD
+            cutoff_ts (float): Cutoff-Zeitpunkt als Timestamp für Dateien ohne Datum im Namen
+        
+        Returns:
+            list: Pfade der gelöschten Dateien
+        """
+        cat_dir = self.dirs[category]
+        deleted = []
+        append = deleted.append
+        match_name = _FN_RE.match
+        
+        # Dateien direkt im Kategorieverzeichnis
+        try:
+            with os.scandir(cat_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(_CLEAN_SUFFIXES) or not entry.is_file(follow_symlinks=False):
                         continue
                     
-                    file_path = os.path.join(self.dirs[cat], filename)
-                    
+                    # Erstellungsdatum aus dem Dateinamen (YYYYMMDD ist als String sortierbar);
+                    # ohne Datum im Namen wird das Dateisystem-Datum verwendet
+                    match = match_name(entry.name)
                     try:
-                        # Versuche, Erstellungsdatum aus Dateinamen zu extrahieren
-                        date_part = filename.split('_')[1][:8]  # YYYYMMDD
-                        file_date = datetime.strptime(date_part, '%Y%m%d')
+                        if match:
+                            too_old = match.group(2) < cutoff_str
+                        else:
+                            too_old = entry.stat().st_mtime < cutoff_ts
+                        
+                        if too_old:
+                            os.unlink(entry.path)
+                            if not entry.name.endswith(_TEMP_SUFFIX):
+                                append(entry.path)
+                    except OSError:
+                        # Bei Fehlern überspringen
+                        continue
+        except OSError as e:
+            self._log('warning', "Fehler beim Durchsuchen von %s: %s", cat_dir, e)
+        
+        for date_str, day_dir in self._day_dirs(category):
+            if date_str >= cutoff_str:
+                break
+            
+            try:
+                with os.scandir(day_dir) as it:
+                    for entry in it:
+                        if not entry.name.endswith(_CLEAN_SUFFIXES) or not entry.is_file(follow_symlinks=False):
+                            continue
                         
-                        if file_date < cutoff_date:
-                            os.remove(file_path)
-                            deleted_count += 1
-                    except:
-                        # Wenn kein Datum aus dem Dateinamen extrahiert werden kann,
-                        # versuche es mit dem Dateisystem-Datum
                         try:
-                            file_mtime = datetime.fromtimestamp(os.path.getmtime(file_path))
-                            if file_mtime < cutoff_date:
-                                os.remove(file_path)
-                                deleted_count += 1
-                        except:
+                            os.unlink(entry.path)
+                            if not entry.name.endswith(_TEMP_SUFFIX):
+                                append(entry.path)
+                        except OSError:
                             # Bei Fehlern überspringen
                             continue
+            except OSError as e:
+                self._log('warning', "Fehler beim Durchsuchen von %s: %s", day_dir, e)
+                continue
             
-            self._log(f"{deleted_count} alte Datendateien gelöscht")
-            return deleted_count
+            # Leere Tages-, Monats- und Jahresverzeichnisse entfernen
+            path = day_dir
+            for _ in range(3):
+                try:
+                    os.rmdir(path)
+                except OSError:
+                    break
+                path = os.path.dirname(path)
+        
+        return deleted
+    
+    @staticmethod
+    def _day_dir(cat_dir, date_str):
+        """Liefert das Tagesverzeichnis für ein Datum.
+        
+        Args:
+            cat_dir (str): Kategorieverzeichnis
+            date_str (str): Datum im Format YYYYMMDD
             
-        except Exception as e:
-            self._log(f"Fehler bei der Bereinigung alter Daten: {str(e)}", level='error')
-            return 0
+        Returns:
+            str: Pfad <Kategorie>/YYYY/MM/DD
+        """
+        return os.path.join(cat_dir, date_str[:4], date_str[4:6], date_str[6:8])
     
-    def _log(self, message, level='info'):
+    @staticmethod
+    def _numeric_subdirs(path, width):
+        """Liefert die Unterverzeichnisse mit numerischem Namen fester Länge.
+        
+        Args:
+            path (str): Zu durchsuchendes Verzeichnis
+            width (int): Länge des Verzeichnisnamens (4 für Jahre, 2 für Monate und Tage)
+            
+        Returns:
+            list: Nach Namen sortierte DirEntry-Objekte
+        """
+        try:
+            with os.scandir(path) as it:
+                entries = [
+                    entry for entry in it
+                    if len(entry.name) == width and entry.name.isdigit()
+                    and entry.is_dir(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            return []
+        
+        entries.sort(key=lambda entry: entry.name)
+        return entries
+    
+    def _day_dirs(self, category, first=None, last=None):
+        """Liefert die Tagesverzeichnisse einer Kategorie im angegebenen Zeitraum.
+        
+        Jahre und Monate außerhalb des Zeitraums werden übersprungen, ohne ihre
+        Unterverzeichnisse zu lesen.
+        
+        Args:
+            category (str): Datenkategorie
+            first (str, optional): Frühestes Datum im Format YYYYMMDD (einschließlich)
+            last (str, optional): Spätestes Datum im Format YYYYMMDD (einschließlich)
+            
+        Returns:
+            list: Nach Datum sortierte Tupel (YYYYMMDD, Verzeichnispfad)
+        """
+        result = []
+        
+        # Grenzen einmalig als Strings vorbereiten; ohne Angabe ist der Zeitraum offen
+        first = first or '00000000'
+        last = last or '99999999'
+        first_year, last_year = first[:4], last[:4]
+        first_month, last_month = first[:6], last[:6]
+        
+        for year in self._numeric_subdirs(self.dirs[category], 4):
+            if not first_year <= year.name <= last_year:
+                continue
+            
+            for month in self._numeric_subdirs(year.path, 2):
+                year_month = year.name + month.name
+                if not first_month <= year_month <= last_month:
+                    continue
+                
+                for day in self._numeric_subdirs(month.path, 2):
+                    date_str = year_month + day.name
+                    if not first <= date_str <= last:
+                        continue
+                    result.append((date_str, day.path))
+        
+        return result
+    
+    def _list_day(self, day_dir):
+        """Liefert die gespeicherten Dateien eines Tagesverzeichnisses.
+        
+        Das Listing wird zwischengespeichert und nur neu eingelesen, wenn sich
+        die Änderungszeit des Verzeichnisses geändert hat.
+        
+        Args:
+            day_dir (str): Tagesverzeichnis
+            
+        Returns:
+            tuple: (sortierte Liste der Dateipfade, dict Bezeichner -> sortierte Dateipfade);
+                leer, wenn das Verzeichnis nicht existiert
+        """
+        try:
+            stamp = os.stat(day_dir).st_mtime_ns
+        except FileNotFoundError:
+            return [], {}
+        
+        cached = self._dir_cache.get(day_dir)
+        if cached is not None and cached[0] == stamp:
+            return cached[1], cached[2]
+        
+        files = []
+        by_article = {}
+        append = files.append
+        add_to_article = by_article.setdefault
+        match_name = _FN_RE.match
+        with os.scandir(day_dir) as it:
+            for entry in it:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                
+                match = match_name(entry.name)
+                if match:
+                    path = entry.path
+                    append(path)
+                    add_to_article(match.group(1), []).append(path)
+        
+        files.sort()
+        for paths in by_article.values():
+            paths.sort()
+        
+        self._dir_cache[day_dir] = (stamp, files, by_article)
+        return files, by_article
+    
+    def _migrate_flat_files(self):
+        """Verschiebt Dateien aus dem flachen Layout in die Tagesverzeichnisse.
+        
+        Dateien, deren Name kein Datum enthält, bleiben im Kategorieverzeichnis.
+        """
+        moved = 0
+        
+        for cat_dir in self.dirs.values():
+            with os.scandir(cat_dir) as it:
+                entries = [entry for entry in it if entry.is_file(follow_symlinks=False)]
+            
+            for entry in entries:
+                match = _FN_RE.match(entry.name)
+                if not match:
+                    continue
+                
+                try:
+                    day_dir = self._day_dir(cat_dir, match.group(2))
+                    os.makedirs(day_dir, exist_ok=True)
+                    os.replace(entry.path, os.path.join(day_dir, entry.name))
+                    moved += 1
+                except OSError as e:
+                    self._log('error', "Fehler beim Verschieben von %s: %s", entry.path, e)
+        
+        if moved:
+            self._log('info', "%d Datendateien in Tagesverzeichnisse verschoben", moved)
+    
+    def _log(self, level, message, *args):
         """Hilfsmethode für Logging.
         
+        Die Argumente werden wie bei logging erst formatiert, wenn die Meldung
+        tatsächlich ausgegeben wird.
+        
         Args:
-            message (str): Log-Nachricht
             level (str): Log-Level ('info', 'warning', 'error', 'debug')
+            message (str): Log-Nachricht mit %-Platzhaltern
+            *args: Werte für die Platzhalter
         """
         if not self.logger:
-            print(f"[Storage] {level.upper()}: {message}")
+            print(f"[Storage] {level.upper()}: {message % args if args else message}")
             return
         
         if level == 'info':
-            self.logger.log_info(message)
+            self.logger.log_info(message, *args)
         elif level == 'warning':
-            self.logger.log_warning(message)
+            self.logger.log_warning(message, *args)
         elif level == 'error':
-            self.logger.log_error(message)
+            self.logger.log_error(message, *args)
         elif level == 'debug':
-            self.logger.log_debug(message)
+            self.logger.log_debug(message, *args)